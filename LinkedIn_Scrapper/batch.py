@@ -0,0 +1,192 @@
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .driver_pool import DriverPool
+from .main import load_credentials, scrape_profile
+import metrics
+
+SCRAPE_RETRIES = metrics.counter("scrape_retries_total", "Failed scrape attempts that were retried.")
+RATE_LIMIT_WAIT_SECONDS = metrics.histogram("scrape_rate_limit_wait_seconds", "Time spent waiting for the scrape rate limiter.")
+
+
+DEFAULT_WORKERS = 4
+# Profiles per second across all workers, with a small burst allowance
+DEFAULT_RATE = 0.5
+DEFAULT_BURST = 2
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF = 5.0
+STATUS_FILE = "scrape_status.jsonl"
+
+# Per-URL statuses recorded in the status file
+QUEUED = "queued"
+RUNNING = "running"
+RETRYING = "retrying"
+DONE = "done"
+FAILED = "failed"
+
+
+class RateLimiter:
+    """Thread-safe token bucket shared by all scraping workers."""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a token is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class ScrapeStatusTracker:
+    """
+    Per-URL scrape status, persisted as an append-only JSON lines log so a batch can be resumed.
+    Each change appends one line; the current status of a URL is its last line in the log.
+    """
+
+    def __init__(self, path=STATUS_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self.statuses = {}
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                for line_number, line in enumerate(f, start=1):
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Most likely a line cut short by a crash mid-write
+                        print(f"Skipping unreadable line {line_number} of {path}.")
+                        continue
+                    self.statuses.setdefault(record.pop("url"), {"attempts": 0}).update(record)
+
+    def get(self, url):
+        """Returns the last recorded status of url, or None if it has never been queued."""
+        return self.statuses.get(url, {}).get("status")
+
+    def update(self, url, status, **details):
+        """Records a new status (and details such as attempts or error) for url and appends it to the log."""
+        self.update_many([url], status, **details)
+
+    def update_many(self, urls, status, **details):
+        """Records the same status for several URLs with a single write to the log."""
+        now = time.time()
+        lines = []
+        with self._lock:
+            for url in urls:
+                entry = self.statuses.setdefault(url, {"attempts": 0})
+                entry.update(details, status=status, updated_at=now)
+                lines.append(json.dumps({"url": url, **details, "status": status, "updated_at": now}) + "\n")
+            with open(self.path, 'a') as f:
+                f.writelines(lines)
+
+    def summary(self):
+        """Returns the number of URLs in each status."""
+        counts = {}
+        for entry in self.statuses.values():
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        return counts
+
+
+def _scrape_with_retries(url, pool, limiter, tracker, max_retries, backoff):
+    for attempt in range(1, max_retries + 1):
+        with RATE_LIMIT_WAIT_SECONDS.time():
+            limiter.acquire()
+        tracker.update(url, RUNNING, attempts=attempt)
+        try:
+            scrape_profile(url, pool=pool)
+        except Exception as e:
+            if attempt == max_retries:
+                tracker.update(url, FAILED, error=str(e))
+                return False
+            delay = backoff * (2 ** (attempt - 1)) * (1 + random.random())
+            print(f"Scraping {url} failed ({e}). Retrying in {delay:.1f}s...")
+            tracker.update(url, RETRYING, error=str(e))
+            SCRAPE_RETRIES.inc()
+            time.sleep(delay)
+        else:
+            tracker.update(url, DONE, error=None)
+            return True
+    return False
+
+def scrape_many(
+    urls,
+    workers=DEFAULT_WORKERS,
+    rate=DEFAULT_RATE,
+    burst=DEFAULT_BURST,
+    max_retries=DEFAULT_MAX_RETRIES,
+    backoff=DEFAULT_BACKOFF,
+    headless=True,
+    status_file=STATUS_FILE,
+    retry_failed=False,
+):
+    """
+    Scrapes many profiles in parallel with `workers` headless browsers.
+    A global rate limiter caps the request rate across workers and failed profiles are retried
+    with exponential backoff. Profiles are saved to the profile store as with scrape_profile, and
+    per-URL progress is recorded in status_file. URLs already marked done are skipped.
+    Returns a dict of status counts.
+    """
+    tracker = ScrapeStatusTracker(status_file)
+    skip = {DONE} if retry_failed else {DONE, FAILED}
+    todo = [url for url in dict.fromkeys(urls) if tracker.get(url) not in skip]
+    tracker.update_many(todo, QUEUED)
+    print(f"Scraping {len(todo)} profiles with {workers} workers ({len(urls) - len(todo)} skipped)")
+
+    email, password = load_credentials()
+    pool = DriverPool(email, password, size=workers, headless=headless)
+    limiter = RateLimiter(rate, burst)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_scrape_with_retries, url, pool, limiter, tracker, max_retries, backoff)
+                for url in todo
+            ]
+            for done_count, _ in enumerate(as_completed(futures), start=1):
+                if done_count % 10 == 0 or done_count == len(futures):
+                    print(f"{done_count}/{len(futures)} profiles processed: {tracker.summary()}")
+    finally:
+        pool.close()
+    return tracker.summary()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape a list of LinkedIn profile URLs in parallel.")
+    parser.add_argument("urls_file", help="Text file with one LinkedIn profile URL per line.")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Number of parallel browser sessions.")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help="Maximum profiles per second across all workers.")
+    parser.add_argument("--max-retries", type=int, default=DEFAULT_MAX_RETRIES, help="Attempts per profile before it is marked failed.")
+    parser.add_argument("--status-file", default=STATUS_FILE, help="JSON lines log tracking per-URL status.")
+    parser.add_argument("--retry-failed", action="store_true", help="Also retry URLs marked failed in the status file.")
+    parser.add_argument("--show-browser", action="store_true", help="Run browsers with a visible window.")
+    metrics.add_arguments(parser)
+    args = parser.parse_args()
+    metrics.configure_from_args(args)
+
+    with open(args.urls_file, 'r') as f:
+        urls = [line.strip() for line in f if line.strip()]
+
+    print(scrape_many(
+        urls,
+        workers=args.workers,
+        rate=args.rate,
+        max_retries=args.max_retries,
+        status_file=args.status_file,
+        retry_failed=args.retry_failed,
+        headless=not args.show_browser,
+    ))
@@ -0,0 +1,189 @@
+import argparse
+import functools
+import json
+import os
+import statistics
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from ..objects import to_dict
+from ..page_parser import parse_experiences, parse_educations
+
+
+# Offline benchmark and regression check for the profile extraction logic.
+# Each directory under fixtures/ is a saved profile laid out like the live site:
+#   <profile>/index.html, <profile>/details/experience/index.html, <profile>/details/education/index.html
+# and an expected.json with the entries the parser must produce.
+#
+#   python -m LinkedIn_Scrapper.benchmarks.bench_parser                 # parse fixtures directly
+#   python -m LinkedIn_Scrapper.benchmarks.bench_parser --check         # fail if output drifts from expected.json
+#   python -m LinkedIn_Scrapper.benchmarks.bench_parser --webdriver     # drive Person through a local HTTP server
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SECTIONS = {
+    "experiences": ("details/experience/index.html", parse_experiences),
+    "educations": ("details/education/index.html", parse_educations),
+}
+
+
+def discover_profiles(fixtures_dir=FIXTURES_DIR):
+    """Returns the names of the fixture profiles, sorted."""
+    return sorted(
+        name for name in os.listdir(fixtures_dir)
+        if os.path.exists(os.path.join(fixtures_dir, name, SECTIONS["experiences"][0]))
+    )
+
+def load_pages(profile, fixtures_dir=FIXTURES_DIR):
+    """Reads a profile's details pages into memory so file I/O is not part of the measurement."""
+    pages = {}
+    for section, (path, _) in SECTIONS.items():
+        with open(os.path.join(fixtures_dir, profile, path), 'r', encoding='utf-8') as f:
+            pages[section] = f.read()
+    return pages
+
+def parse_profile(pages):
+    """Parses every section of a profile. Returns ({section: entries}, {section: seconds})."""
+    results, timings = {}, {}
+    for section, (_, parser) in SECTIONS.items():
+        start = time.perf_counter()
+        results[section] = parser(pages[section])
+        timings[section] = time.perf_counter() - start
+    return results, timings
+
+def to_jsonable(results):
+    """Converts parsed entries to plain dicts for comparison with expected.json."""
+    return {section: [to_dict(entry) for entry in entries] for section, entries in results.items()}
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+def summarise(label, samples):
+    """Formats mean / p50 / p95 / max of a list of durations in milliseconds."""
+    ms = [s * 1000 for s in samples]
+    return (
+        f"{label:<28} mean {statistics.mean(ms):8.3f} ms   p50 {_percentile(ms, 0.5):8.3f} ms"
+        f"   p95 {_percentile(ms, 0.95):8.3f} ms   max {max(ms):8.3f} ms"
+    )
+
+def run_parse_benchmark(profiles, repeat, fixtures_dir=FIXTURES_DIR):
+    """Parses every fixture `repeat` times and prints per-profile latency, per-section time and throughput."""
+    pages = {profile: load_pages(profile, fixtures_dir) for profile in profiles}
+    total_bytes = sum(len(page.encode('utf-8')) for profile_pages in pages.values() for page in profile_pages.values())
+
+    profile_latency = {profile: [] for profile in profiles}
+    section_latency = {section: [] for section in SECTIONS}
+    entries = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for profile in profiles:
+            results, timings = parse_profile(pages[profile])
+            profile_latency[profile].append(sum(timings.values()))
+            for section, seconds in timings.items():
+                section_latency[section].append(seconds)
+            entries += sum(len(section_entries) for section_entries in results.values())
+    elapsed = time.perf_counter() - start
+
+    print(f"Parsed {len(profiles)} fixture profiles x {repeat} runs in {elapsed:.3f}s\n")
+    print("Per-profile latency:")
+    for profile, samples in profile_latency.items():
+        print("  " + summarise(profile, samples))
+    print("Per-section time:")
+    for section, samples in section_latency.items():
+        print("  " + summarise(section, samples))
+    parsed_profiles = len(profiles) * repeat
+    print("Throughput:")
+    print(f"  {parsed_profiles / elapsed:10.1f} profiles/s")
+    print(f"  {parsed_profiles * len(SECTIONS) / elapsed:10.1f} pages/s")
+    print(f"  {entries / elapsed:10.1f} entries/s")
+    print(f"  {total_bytes * repeat / elapsed / 1e6:10.2f} MB/s of HTML")
+
+def check_expected(profiles, update=False, fixtures_dir=FIXTURES_DIR):
+    """Compares the parser output with each fixture's expected.json. Returns True if all match."""
+    ok = True
+    for profile in profiles:
+        results, _ = parse_profile(load_pages(profile, fixtures_dir))
+        actual = to_jsonable(results)
+        expected_path = os.path.join(fixtures_dir, profile, "expected.json")
+        if update:
+            with open(expected_path, 'w', encoding='utf-8') as f:
+                json.dump(actual, f, indent=4, ensure_ascii=False)
+            print(f"updated  {profile}")
+            continue
+        with open(expected_path, 'r', encoding='utf-8') as f:
+            expected = json.load(f)
+        if actual == expected:
+            print(f"ok       {profile}")
+        else:
+            ok = False
+            print(f"MISMATCH {profile}")
+            for section in SECTIONS:
+                if actual.get(section) != expected.get(section):
+                    print(f"  {section}: expected {json.dumps(expected.get(section), ensure_ascii=False)}")
+                    print(f"  {' ' * len(section)}  actual   {json.dumps(actual.get(section), ensure_ascii=False)}")
+    return ok
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+def serve_fixtures(fixtures_dir=FIXTURES_DIR):
+    """Serves the fixtures directory on a free localhost port. Returns the running server."""
+    handler = functools.partial(_QuietHandler, directory=fixtures_dir)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def run_webdriver_benchmark(profiles, repeat, fixtures_dir=FIXTURES_DIR):
+    """
+    Runs Person.get_experiences / get_educations against the fixtures served over local HTTP,
+    once per extraction mode, so WebDriver round-trip cost can be compared with page-source parsing.
+    """
+    from ..driver_pool import new_firefox_driver
+    from ..scraper import Person, PAGE_SOURCE, WEBDRIVER
+
+    server = serve_fixtures(fixtures_dir)
+    driver = new_firefox_driver(headless=True)
+    try:
+        for mode in (WEBDRIVER, PAGE_SOURCE):
+            section_latency = {section: [] for section in SECTIONS}
+            profile_latency = []
+            for _ in range(repeat):
+                for profile in profiles:
+                    url = f"http://127.0.0.1:{server.server_port}/{profile}/"
+                    person = Person(linkedin_url=url, driver=driver, scrape=False, close_on_complete=False, extraction_mode=mode)
+                    with person.timed("experiences"):
+                        person.get_experiences()
+                    with person.timed("educations"):
+                        person.get_educations()
+                    profile_latency.append(sum(person.timings.values()))
+                    for section, seconds in person.timings.items():
+                        section_latency[section].append(seconds)
+            print(f"\nExtraction mode: {mode}")
+            print("  " + summarise("per profile", profile_latency))
+            for section, samples in section_latency.items():
+                print("  " + summarise(section, samples))
+    finally:
+        driver.quit()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark and regression-check the LinkedIn profile parser on saved HTML fixtures.")
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="Directory of fixture profiles.")
+    parser.add_argument("--repeat", type=int, default=200, help="Number of passes over the fixtures.")
+    parser.add_argument("--check", action="store_true", help="Compare parser output with expected.json and exit non-zero on drift.")
+    parser.add_argument("--update-expected", action="store_true", help="Rewrite expected.json from the current parser output.")
+    parser.add_argument("--webdriver", action="store_true", help="Drive Person through headless Firefox against a local HTTP server.")
+    args = parser.parse_args()
+
+    profiles = discover_profiles(args.fixtures)
+    if args.check or args.update_expected:
+        raise SystemExit(0 if check_expected(profiles, update=args.update_expected, fixtures_dir=args.fixtures) else 1)
+    if args.webdriver:
+        run_webdriver_benchmark(profiles, args.repeat, fixtures_dir=args.fixtures)
+    else:
+        run_parse_benchmark(profiles, args.repeat, fixtures_dir=args.fixtures)
@@ -0,0 +1,81 @@
+import argparse
+import dataclasses
+import gc
+import time
+import tracemalloc
+
+from ..objects import Contact, Experience, Education, Interest, Accomplishment, to_dict
+
+
+# Memory and serialisation comparison of the slotted scraper records against equivalent
+# plain (dict-backed) dataclasses, on a synthetic batch shaped like a set of parsed profiles.
+#
+#   python -m LinkedIn_Scrapper.benchmarks.bench_records --profiles 10000
+
+RECORD_TYPES = (Experience, Education, Interest, Accomplishment, Contact)
+# Records per synthetic profile
+PROFILE_SHAPE = {Experience: 4, Education: 2, Interest: 3, Accomplishment: 2, Contact: 5}
+
+
+def plain_dataclass(cls):
+    """Builds an unslotted dataclass with the same fields as cls, for comparison."""
+    return dataclasses.make_dataclass(
+        f"Plain{cls.__name__}",
+        [(field.name, field.type, dataclasses.field(default=field.default)) for field in dataclasses.fields(cls)],
+    )
+
+def sample_values(cls, i):
+    """Distinct string values for every field of cls, so no instance shares its strings."""
+    return {field.name: f"{field.name} {i}" for field in dataclasses.fields(cls)}
+
+def measure_memory(types, n_profiles):
+    """Returns (records, bytes allocated for the records themselves, excluding their string values)."""
+    values = [[sample_values(cls, i * 10 + j) for cls, count in PROFILE_SHAPE.items() for j in range(count)] for i in range(n_profiles)]
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    records = []
+    for profile_values in values:
+        k = 0
+        for cls, count in PROFILE_SHAPE.items():
+            for _ in range(count):
+                records.append(types[cls](**profile_values[k]))
+                k += 1
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return records, after - before
+
+def measure_serialisation(records, convert, repeat):
+    """Returns the best time in seconds over `repeat` runs to convert every record to a dict."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for record in records:
+            convert(record)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare memory use and serialisation speed of slotted vs plain scraper records.")
+    parser.add_argument("--profiles", type=int, default=10000, help="Number of synthetic profiles to build.")
+    parser.add_argument("--repeat", type=int, default=5, help="Serialisation passes (best is reported).")
+    args = parser.parse_args()
+
+    slotted = {cls: cls for cls in RECORD_TYPES}
+    plain = {cls: plain_dataclass(cls) for cls in RECORD_TYPES}
+
+    slotted_records, slotted_bytes = measure_memory(slotted, args.profiles)
+    plain_records, plain_bytes = measure_memory(plain, args.profiles)
+    n_records = len(slotted_records)
+
+    print(f"{args.profiles} profiles, {n_records} records")
+    print(f"  plain dataclasses   {plain_bytes / 1e6:8.2f} MB   {plain_bytes / n_records:6.1f} bytes/record")
+    print(f"  slotted records     {slotted_bytes / 1e6:8.2f} MB   {slotted_bytes / n_records:6.1f} bytes/record")
+    print(f"  saving              {(1 - slotted_bytes / plain_bytes) * 100:8.1f} %")
+
+    asdict_time = measure_serialisation(plain_records, dataclasses.asdict, args.repeat)
+    to_dict_time = measure_serialisation(slotted_records, to_dict, args.repeat)
+    print("Serialisation to dicts:")
+    print(f"  dataclasses.asdict  {asdict_time * 1000:8.1f} ms   {n_records / asdict_time:12.0f} records/s")
+    print(f"  to_dict             {to_dict_time * 1000:8.1f} ms   {n_records / to_dict_time:12.0f} records/s")
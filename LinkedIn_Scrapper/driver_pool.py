@@ -0,0 +1,166 @@
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from .actions import login
+
+
+DEFAULT_POOL_SIZE = 2
+# Sessions are recycled after this many profiles or this many seconds, whichever comes first
+DEFAULT_MAX_USES = 50
+DEFAULT_MAX_AGE = 30 * 60
+CHECKOUT_TIMEOUT = 300
+
+
+def new_firefox_driver(headless=False):
+    """Starts a Firefox WebDriver, optionally headless."""
+    options = webdriver.FirefoxOptions()
+    if headless:
+        options.add_argument("-headless")
+    return webdriver.Firefox(options=options)
+
+
+class PooledDriver:
+    """A WebDriver session owned by a DriverPool, with the bookkeeping needed to recycle it."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = time.time()
+        self.uses = 0
+
+
+class DriverPool:
+    """
+    Pool of warm, already logged-in WebDriver sessions.
+    Sessions are created lazily (up to size), health-checked on checkout and recycled after
+    max_uses profiles, max_age seconds, or any WebDriver error while checked out.
+    """
+
+    def __init__(
+        self,
+        email,
+        password,
+        size=DEFAULT_POOL_SIZE,
+        max_uses=DEFAULT_MAX_USES,
+        max_age=DEFAULT_MAX_AGE,
+        headless=False,
+        driver_factory=None,
+    ):
+        self.email = email
+        self.password = password
+        self.size = size
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.driver_factory = driver_factory or (lambda: new_firefox_driver(headless=headless))
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+
+    def _start_session(self):
+        driver = self.driver_factory()
+        try:
+            login(driver, self.email, self.password)
+        except Exception:
+            driver.quit()
+            raise
+        return PooledDriver(driver)
+
+    def _discard(self, pooled):
+        with self._lock:
+            self._created -= 1
+        try:
+            pooled.driver.quit()
+        except WebDriverException:
+            pass
+
+    def is_healthy(self, pooled):
+        """A session is healthy if it is young enough, under its use limit and still logged in."""
+        if pooled.uses >= self.max_uses or time.time() - pooled.created_at >= self.max_age:
+            return False
+        try:
+            # Cheap protocol round trip that fails if the browser has died
+            _ = pooled.driver.current_url
+            return pooled.driver.get_cookie("li_at") is not None
+        except WebDriverException:
+            return False
+
+    def acquire(self, timeout=CHECKOUT_TIMEOUT):
+        """
+        Returns a healthy, logged-in PooledDriver, starting a new session if the pool is not full.
+        Raises TimeoutError after timeout seconds, or RuntimeError if a newly started session is not logged in.
+        """
+        if self._closed:
+            raise RuntimeError("DriverPool is closed")
+        deadline = time.time() + timeout
+        while True:
+            if time.time() >= deadline:
+                raise TimeoutError("Timed out waiting for a WebDriver session")
+            created = False
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                pooled = None
+                with self._lock:
+                    can_create = self._created < self.size
+                    if can_create:
+                        self._created += 1
+                if can_create:
+                    try:
+                        pooled = self._start_session()
+                    except Exception:
+                        with self._lock:
+                            self._created -= 1
+                        raise
+                    created = True
+                else:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise TimeoutError("Timed out waiting for a WebDriver session")
+                    try:
+                        pooled = self._idle.get(timeout=remaining)
+                    except queue.Empty:
+                        continue
+
+            if self.is_healthy(pooled):
+                pooled.uses += 1
+                return pooled
+            self._discard(pooled)
+            if created:
+                # Retrying would start yet another browser and login (e.g. if LinkedIn is blocking it)
+                raise RuntimeError("New WebDriver session is not logged in to LinkedIn")
+            print("Recycling WebDriver session...")
+
+    def release(self, pooled, healthy=True):
+        """Returns a session to the pool, or quits it if it is unhealthy or the pool is closed."""
+        if not healthy or self._closed:
+            self._discard(pooled)
+        else:
+            self._idle.put(pooled)
+
+    @contextmanager
+    def checkout(self, timeout=CHECKOUT_TIMEOUT):
+        """Context manager yielding a logged-in driver. Sessions that raise WebDriver errors are recycled."""
+        pooled = self.acquire(timeout=timeout)
+        healthy = True
+        try:
+            yield pooled.driver
+        except WebDriverException:
+            healthy = False
+            raise
+        finally:
+            self.release(pooled, healthy=healthy)
+
+    def close(self):
+        """Quits every idle session. Sessions still checked out are quit when they are returned."""
+        self._closed = True
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(pooled)
@@ -1,13 +1,38 @@
+import atexit
+import hashlib
 import os
 import json
+import threading
+import time
 
-from .actions import login
 from .scraper import Person
+from .objects import to_dict
+from .driver_pool import DriverPool
 
-from selenium import webdriver
 from dotenv import load_dotenv
 
-def scrape_profile(linkedin_url):      
+from profile_store import get_profile_store, PROFILE_METADATA_FIELDS
+import metrics
+
+SCRAPE_PROFILES = metrics.counter("scrape_profiles_total", "Profiles scraped, by outcome.")
+SCRAPE_PROFILE_SECONDS = metrics.histogram("scrape_profile_seconds", "End-to-end time to scrape and save one profile.")
+DRIVER_WAIT_SECONDS = metrics.histogram("driver_pool_wait_seconds", "Time spent waiting for a pooled browser session.")
+
+_driver_pool = None
+_driver_pool_lock = threading.Lock()
+
+# Person.contacts lists the scraping account's own connections, not the candidate's, so it is not
+# saved with new profiles and is ignored in ones saved before
+NON_CANDIDATE_FIELDS = ("contacts",)
+
+def profile_content_hash(profile_data):
+    """Hash of a scraped profile's content, ignoring the bookkeeping and non-candidate fields."""
+    ignored = PROFILE_METADATA_FIELDS + NON_CANDIDATE_FIELDS
+    content = {key: value for key, value in profile_data.items() if key not in ignored}
+    return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+def load_credentials():
+    """Reads the LinkedIn login used for scraping from the .env file."""
     if not os.path.exists(".env"):
         print(".env file doesn't exists.")
       
@@ -18,15 +43,42 @@ def scrape_profile(linkedin_url):
         
     if not PROXY_EMAIL_ID or not PROXY_PASSWORD:
         raise Exception("Please set PROXY_EMAIL_ID and PROXY_EMAIL_PASSWORD in your .env file.")
+    return PROXY_EMAIL_ID, PROXY_PASSWORD
 
-    driver = webdriver.Firefox()
-    login(driver, PROXY_EMAIL_ID, PROXY_PASSWORD) 
+def get_driver_pool():
+    """Returns the process-wide pool of logged-in WebDriver sessions, creating it on first use."""
+    global _driver_pool
+    if _driver_pool is None:
+        with _driver_pool_lock:
+            if _driver_pool is None:
+                email, password = load_credentials()
+                _driver_pool = DriverPool(email, password)
+                atexit.register(_driver_pool.close)
+    return _driver_pool
 
-    person = Person(linkedin_url=linkedin_url,  driver=driver, get=True, scrape=True)
+def scrape_profile(linkedin_url, pool=None):
+    """
+    Scrapes a LinkedIn profile and saves it to the profile store.
+    Uses a warm, logged-in session from pool (the shared pool by default) instead of
+    starting and logging in a new browser for every profile.
+    """
+    pool = pool or get_driver_pool()
 
-    if driver:
-        driver.quit()
+    try:
+        with metrics.span("scrape_profile"), SCRAPE_PROFILE_SECONDS.time():
+            wait_start = time.perf_counter()
+            with pool.checkout() as driver:
+                DRIVER_WAIT_SECONDS.observe(time.perf_counter() - wait_start)
+                person = Person(linkedin_url=linkedin_url, driver=driver, scrape=True, close_on_complete=False)
+            _save_profile(person)
+    except Exception:
+        SCRAPE_PROFILES.inc(status="error")
+        raise
+    SCRAPE_PROFILES.inc(status="ok")
+    return "Scraping Successful"
 
+def _save_profile(person):
+    """Serialises a scraped Person and saves it to the profile store. Returns the saved profile."""
     scapping_fields = [
         "linkedin_url",
         "name",
@@ -37,68 +89,28 @@ def scrape_profile(linkedin_url):
         "interests",
         "accomplishments",
         # "also_viewed_urls",
-        "contacts", 
+        # "contacts" (see NON_CANDIDATE_FIELDS)
     ]
     data = {key: getattr(person, key) for key in scapping_fields}
 
-    def experience_to_dict(experience):
-        return {
-            'institution_name': experience.institution_name,
-            'linkedin_url': experience.linkedin_url,
-            'website': experience.website,
-            'industry': experience.industry,
-            'type': experience.type,
-            'headquarters': experience.headquarters,
-            'company_size': experience.company_size,
-            'founded': experience.founded,
-            'from_date': experience.from_date,
-            'to_date': experience.to_date,
-            'description': experience.description,
-            'position_title': experience.position_title,
-            'duration': experience.duration,
-            'location': experience.location
-        }
-    def education_to_dict(education):
-        return {
-            'institution_name': education.institution_name,
-            'linkedin_url': education.linkedin_url,
-            'website': education.website,
-            'industry': education.industry,
-            'type': education.type,
-            'headquarters': education.headquarters,
-            'company_size': education.company_size,
-            'founded': education.founded,
-            'from_date': education.from_date,
-            'to_date': education.to_date,
-            'description': education.description,
-            'degree': education.degree
-        }
-        
     # Define a function to convert the data to a JSON-serializable format
     def data_to_json(data):
         json_data = {}
         for key, value in data.items():
-            if key == 'experiences':
-                json_data[key] = [experience_to_dict(experience) for experience in value]
-            elif key == 'educations':            
-                json_data[key] = [education_to_dict(education) for education in value]
+            if isinstance(value, list):
+                # experiences, educations, interests and accomplishments are lists of records
+                json_data[key] = [to_dict(record) for record in value]
             else:
                 json_data[key] = value
         return json_data
 
-    # Save the data in a JSON file
-    username = person.linkedin_url.split('/')[-2]
-    filename = f"{username}.json"
-
-    scarped_data_dir = './scraped_data'
-
-    if not os.path.exists(scarped_data_dir):
-        os.mkdir(scarped_data_dir)
+    json_data = data_to_json(data)
+    json_data['scraped_at'] = time.time()
+    json_data['content_hash'] = profile_content_hash(json_data)
 
-    with open(os.path.join(scarped_data_dir, filename), 'w') as f:
-        json.dump(data_to_json(data), f, indent=4)
-        
-    return "Scraping Successful"
+    # Save the data in the profile store
+    get_profile_store().put(json_data)
+    return json_data
 
 if __name__ == "__main__":    
 #     # pass
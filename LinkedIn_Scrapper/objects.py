@@ -1,4 +1,7 @@
+from contextlib import contextmanager
 from dataclasses import dataclass
+import dataclasses
+import functools
 import time
 
 from selenium.webdriver import Firefox
@@ -7,19 +10,27 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions
+from selenium.common.exceptions import TimeoutException
+
+import metrics
 
 
 VERIFY_LOGIN_ID = "global-nav__primary-link"
+
+SCRAPE_SECTION_SECONDS = metrics.histogram("scrape_section_seconds", "Time spent scraping each profile section.")
 # REMEMBER_PROMPT = 'remember-me-prompt__form-primary'
 
-@dataclass
+# Scraped records are slotted: no per-instance __dict__, which matters when tens of thousands
+# of parsed profiles are held in memory for batch scoring. Serialise them with to_dict.
+
+@dataclass(slots=True)
 class Contact:
     name: str = None
     occupation: str = None
     url: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Institution:
     institution_name: str = None
     linkedin_url: str = None
@@ -30,7 +41,7 @@ class Institution:
     company_size: int = None
     founded: int = None
 
-@dataclass
+@dataclass(slots=True)
 class Experience(Institution):
     from_date: str = None
     to_date: str = None
@@ -39,26 +50,42 @@ class Experience(Institution):
     duration: str = None
     location: str = None
 
-@dataclass
+@dataclass(slots=True)
 class Education(Institution):
     from_date: str = None
     to_date: str = None
     description: str = None
     degree: str = None
 
-@dataclass
+@dataclass(slots=True)
 class Interest(Institution):
-    title = None
+    title: str = None
 
-@dataclass
+@dataclass(slots=True)
 class Accomplishment(Institution):
-    category = None
-    title = None
+    category: str = None
+    title: str = None
+
+
+@functools.cache
+def record_fields(cls):
+    """Field names of a record class, in declaration order (base class fields first)."""
+    return tuple(field.name for field in dataclasses.fields(cls))
+
+def to_dict(record):
+    """
+    Converts a scraped record to a plain dict of its fields.
+    Records only hold scalar values, so this is a flat read of the slots rather than the
+    recursive deep copy done by dataclasses.asdict.
+    """
+    return {name: getattr(record, name) for name in record_fields(type(record))}
 
 @dataclass
 class Scraper:
     driver: Firefox = None
     WAIT_FOR_ELEMENT_TIMEOUT = 5
+    # Grace period for optional sections once the page itself has finished loading
+    OPTIONAL_ELEMENT_TIMEOUT = 1
     TOP_CARD = "pv-top-card"
 
     @staticmethod
@@ -96,6 +123,48 @@ class Scraper:
         )
 
 
+    def wait_for_page_ready(self, timeout=None):
+        """Waits until the browser reports the document as fully loaded."""
+        try:
+            WebDriverWait(self.driver, timeout or self.WAIT_FOR_ELEMENT_TIMEOUT).until(
+                lambda driver: driver.execute_script('return document.readyState;') == 'complete'
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def find_optional_element(self, by=By.CLASS_NAME, name="pv-top-card", base=None, timeout=None):
+        """
+        Returns the element if the section exists, or None.
+        Waits for the page to load, then only allows a short grace period for late rendering,
+        so a missing optional section costs about OPTIONAL_ELEMENT_TIMEOUT instead of a full timeout.
+        """
+        base = base or self.driver
+        self.wait_for_page_ready()
+        try:
+            return WebDriverWait(base, timeout or self.OPTIONAL_ELEMENT_TIMEOUT, poll_frequency=0.1).until(
+                expected_conditions.presence_of_element_located((by, name))
+            )
+        except TimeoutException:
+            return None
+
+    @contextmanager
+    def timed(self, section):
+        """
+        Records the wall-clock time spent in a scraping section in self.timings, and as a
+        'scrape_section_seconds' histogram / nested span in the process metrics.
+        """
+        if getattr(self, "timings", None) is None:
+            self.timings = {}
+        start = time.perf_counter()
+        try:
+            with metrics.span(f"scrape.{section}"):
+                yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timings[section] = self.timings.get(section, 0.0) + elapsed
+            SCRAPE_SECTION_SECONDS.observe(elapsed, section=section)
+
     def is_signed_in(self):
         try:            
             WebDriverWait(self.driver, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
@@ -0,0 +1,240 @@
+import re
+
+from lxml import html as lxml_html
+
+from .objects import Experience, Education
+
+
+# Parses the experience / education details pages from a single driver.page_source snapshot.
+# The traversal mirrors Person.get_experiences / Person.get_educations element for element, but
+# runs locally on an lxml tree instead of doing one WebDriver round trip per find_element / .text.
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _has_class(class_name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+LIST_CONTAINER_XPATH = f".//*[{_has_class('pvs-list__container')}]"
+LIST_ITEM_XPATH = f".//*[{_has_class('pvs-list__paged-list-item')}]"
+ENTITY_XPATH = ".//div[@data-view-name='profile-component-entity']"
+
+
+def visible_text(element):
+    """
+    Approximates WebElement.text: the element's text with screen-reader-only copies
+    (class 'visually-hidden') left out and whitespace collapsed.
+    """
+    if element is None:
+        return ""
+    parts = []
+
+    def walk(node):
+        if not isinstance(node.tag, str):
+            return
+        if "visually-hidden" in (node.get("class") or "").split():
+            return
+        if node.tag in ("script", "style"):
+            return
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    walk(element)
+    lines = (_WHITESPACE_RE.sub(" ", line).strip() for line in "".join(parts).splitlines())
+    return "\n".join(line for line in lines if line)
+
+def children(element):
+    """Element children only (the equivalent of find_elements(By.XPATH, "*"))."""
+    return [child for child in element if isinstance(child.tag, str)]
+
+def _first(elements):
+    return elements[0] if elements else None
+
+def _span_text(element):
+    span = _first(element.xpath(".//span"))
+    return visible_text(span)
+
+def _split_work_times(work_times):
+    """Splits 'Jan 2020 - Present · 4 yrs' into (from_date, to_date, duration)."""
+    if work_times:
+        parts = work_times.split("·")
+        times = parts[0].strip() if parts else ""
+        duration = parts[1].strip() if len(parts) > 1 else None
+    else:
+        times = ""
+        duration = None
+    from_date = " ".join(times.split(" ")[:2]) if times else ""
+    to_date = " ".join(times.split(" ")[3:]) if times and len(times.split(" ")) > 3 else ""
+    return from_date, to_date, duration
+
+def _main_list(document):
+    main = _first(document.xpath("//main"))
+    if main is None:
+        return None
+    return _first(main.xpath(LIST_CONTAINER_XPATH))
+
+def _entity_parts(position):
+    """Returns (logo element, summary details, summary text) of a list item, or None if it does not match the layout."""
+    entity = _first(position.xpath(ENTITY_XPATH))
+    if entity is None:
+        return None
+    elements = children(entity)
+    if len(elements) < 2:
+        return None
+    details = children(elements[1])
+    summary_details = details[0] if len(details) > 0 else None
+    summary_text = details[1] if len(details) > 1 else None
+    if summary_details is None:
+        return None
+    return elements[0], summary_details, summary_text
+
+def _logo_url(logo_elem):
+    link = _first(children(logo_elem))
+    return link.get("href") if link is not None else None
+
+def _outer_positions(summary_details):
+    first = _first(children(summary_details))
+    return children(first) if first is not None else []
+
+
+def parse_experiences(page_source):
+    """Parses the experiences from the HTML of a /details/experience page."""
+    document = lxml_html.fromstring(page_source)
+    main_list = _main_list(document)
+    if main_list is None:
+        return []
+
+    experiences = []
+    for position in main_list.xpath(LIST_ITEM_XPATH):
+        parts = _entity_parts(position)
+        if parts is None:
+            continue
+        company_logo_elem, position_summary_details, position_summary_text = parts
+
+        company_linkedin_url = _logo_url(company_logo_elem)
+        if not company_linkedin_url:
+            continue
+
+        outer_positions = _outer_positions(position_summary_details)
+        if len(outer_positions) == 4:
+            position_title = _span_text(outer_positions[0])
+            company = _span_text(outer_positions[1])
+            work_times = _span_text(outer_positions[2])
+            location = _span_text(outer_positions[3])
+        elif len(outer_positions) == 3:
+            if "·" in visible_text(outer_positions[2]):
+                position_title = _span_text(outer_positions[0])
+                company = _span_text(outer_positions[1])
+                work_times = _span_text(outer_positions[2])
+                location = ""
+            else:
+                position_title = ""
+                company = _span_text(outer_positions[0])
+                work_times = _span_text(outer_positions[1])
+                location = _span_text(outer_positions[2])
+        else:
+            position_title = ""
+            company = _span_text(outer_positions[0]) if outer_positions else ""
+            work_times = _span_text(outer_positions[1]) if len(outer_positions) > 1 else ""
+            location = ""
+
+        from_date, to_date, duration = _split_work_times(work_times)
+
+        inner_positions = []
+        if position_summary_text is not None and any(
+            child.get("class") == "pvs-list__container" for child in children(position_summary_text)
+        ):
+            container = _first(position_summary_text.xpath(LIST_CONTAINER_XPATH))
+            node = container
+            for _ in range(3):
+                node = _first(children(node)) if node is not None else None
+            if node is not None:
+                inner_positions = node.xpath(LIST_ITEM_XPATH)
+
+        if len(inner_positions) > 1:
+            for description in inner_positions:
+                link = _first(description.xpath(".//a"))
+                if link is None:
+                    continue
+                res = children(link)
+                position_title_elem = res[0] if len(res) > 0 else None
+                work_times_elem = res[1] if len(res) > 1 else None
+                location_elem = res[2] if len(res) > 2 else None
+
+                location = visible_text(_first(children(location_elem))) if location_elem is not None else None
+                if position_title_elem is not None:
+                    title_container = _first(children(position_title_elem))
+                    position_title = visible_text(_first(title_container.xpath(".//*"))) if title_container is not None else ""
+                else:
+                    position_title = ""
+                work_times = visible_text(_first(children(work_times_elem))) if work_times_elem is not None else ""
+                inner_from_date, inner_to_date, inner_duration = _split_work_times(work_times)
+
+                experiences.append(Experience(
+                    position_title=position_title,
+                    from_date=inner_from_date,
+                    to_date=inner_to_date,
+                    duration=inner_duration,
+                    location=location,
+                    description=visible_text(description),
+                    institution_name=company,
+                    linkedin_url=company_linkedin_url,
+                ))
+        else:
+            experiences.append(Experience(
+                position_title=position_title,
+                from_date=from_date,
+                to_date=to_date,
+                duration=duration,
+                location=location,
+                description=visible_text(position_summary_text),
+                institution_name=company,
+                linkedin_url=company_linkedin_url,
+            ))
+    return experiences
+
+def parse_educations(page_source):
+    """Parses the educations from the HTML of a /details/education page."""
+    document = lxml_html.fromstring(page_source)
+    main_list = _main_list(document)
+    if main_list is None:
+        return []
+
+    educations = []
+    for position in main_list.xpath(LIST_ITEM_XPATH):
+        parts = _entity_parts(position)
+        if parts is None:
+            continue
+        institution_logo_elem, position_summary_details, position_summary_text = parts
+
+        institution_linkedin_url = _logo_url(institution_logo_elem)
+        outer_positions = _outer_positions(position_summary_details)
+
+        institution_name = _span_text(outer_positions[0]) if outer_positions else ""
+        degree = _span_text(outer_positions[1]) if len(outer_positions) > 1 else None
+
+        from_date = None
+        to_date = None
+        if len(outer_positions) > 2:
+            times = _span_text(outer_positions[2])
+            if times and "-" in times:
+                split_times = times.split(" ")
+                dash_index = split_times.index("-") if "-" in split_times else -1
+                if dash_index > 0:
+                    from_date = split_times[dash_index - 1]
+                if dash_index < len(split_times) - 1:
+                    to_date = split_times[-1]
+
+        educations.append(Education(
+            from_date=from_date,
+            to_date=to_date,
+            description=visible_text(position_summary_text),
+            degree=degree,
+            institution_name=institution_name,
+            linkedin_url=institution_linkedin_url,
+        ))
+    return educations
@@ -4,8 +4,13 @@ from selenium.webdriver.support import expected_conditions
 from selenium.common.exceptions import NoSuchElementException
 
 from .objects import Experience, Education, Scraper, Interest, Accomplishment, Contact
+from .page_parser import parse_experiences, parse_educations
 import os
 
+# Extraction modes for experiences and educations
+WEBDRIVER = "webdriver"
+PAGE_SOURCE = "page_source"
+
 class Person(Scraper):
     __TOP_CARD = "main"
     __WAIT_FOR_ELEMENT_TIMEOUT = 5
@@ -16,6 +21,7 @@ class Person(Scraper):
         driver=None,
         scrape=True,
         close_on_complete=True,
+        extraction_mode=PAGE_SOURCE,
     ):
         if driver is None:
             print("driver is None")
@@ -23,6 +29,8 @@ class Person(Scraper):
         self.driver = driver
         
         self.linkedin_url = linkedin_url
+        # PAGE_SOURCE parses experiences/educations from one HTML snapshot; WEBDRIVER queries each element live
+        self.extraction_mode = extraction_mode
         self.name = ""
         self.about =  []
         self.location = ""
@@ -32,6 +40,8 @@ class Person(Scraper):
         self.accomplishments = []
         self.also_viewed_urls = []
         self.contacts = []
+        # Wall-clock seconds spent in each scraping section, filled in by scrape_logged_in
+        self.timings = {}
 
         driver.get(linkedin_url)
 
@@ -68,7 +78,15 @@ class Person(Scraper):
             main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
             self.scroll_to_half()
             self.scroll_to_bottom()
-            main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
+            # Core section: the list renders client-side after readyState, so give it the full timeout
+            # rather than the optional-section grace, or a slow render would save an empty profile
+            main_list = self.find_optional_element(name="pvs-list__container", base=main, timeout=self.WAIT_FOR_ELEMENT_TIMEOUT)
+            if main_list is None:
+                print("No experience found...")
+                return
+            if self.extraction_mode == PAGE_SOURCE:
+                self.experiences.extend(parse_experiences(self.driver.page_source))
+                return
             for position in main_list.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item"):
                 position = position.find_element(By.CSS_SELECTOR, "div[data-view-name='profile-component-entity']")
                 
@@ -173,11 +191,11 @@ class Person(Scraper):
                                 to_date=to_date,
                                 duration=duration,
                                 location=location,
-                                description=description,
+                                description=description.text,
                                 institution_name=company,
                                 linkedin_url=company_linkedin_url
                             )
-                            self.add_experience(experience)
+                            self.experiences.append(experience)
                         except (NoSuchElementException, IndexError) as e:
                             # Skip this description if elements are missing
                             continue
@@ -208,7 +226,13 @@ class Person(Scraper):
             main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
             self.scroll_to_half()
             self.scroll_to_bottom()
-            main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
+            main_list = self.find_optional_element(name="pvs-list__container", base=main, timeout=self.WAIT_FOR_ELEMENT_TIMEOUT)
+            if main_list is None:
+                print("No education found...")
+                return
+            if self.extraction_mode == PAGE_SOURCE:
+                self.educations.extend(parse_educations(self.driver.page_source))
+                return
             for position in main_list.find_elements(By.CLASS_NAME,"pvs-list__paged-list-item"):
                 try:
                     position = position.find_element(By.CSS_SELECTOR, "div[data-view-name='profile-component-entity']")
@@ -293,22 +317,16 @@ class Person(Scraper):
         
     def get_interests(self):
         try:
-            _ = WebDriverWait(self.driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
-                expected_conditions.presence_of_element_located(
-                    (
-                        By.XPATH,
-                        "//*[@class='pv-profile-section pv-interests-section artdeco-container-card artdeco-card ember-view']",
-                    )
-                )
-            )
-            interestContainer = self.driver.find_element(By.XPATH,
+            interestContainer = self.find_optional_element(By.XPATH,
                 "//*[@class='pv-profile-section pv-interests-section artdeco-container-card artdeco-card ember-view']"
             )
+            if interestContainer is None:
+                return
             for interestElement in interestContainer.find_elements(By.XPATH,
                 "//*[@class='pv-interest-entity pv-profile-section__card-item ember-view']"
             ):
                 interest = Interest(
-                    interestElement.find_element(By.TAG_NAME, "h3").text.strip()
+                    title=interestElement.find_element(By.TAG_NAME, "h3").text.strip()
                 )
                 self.interests.append(interest)
         except:
@@ -316,17 +334,11 @@ class Person(Scraper):
 
     def get_accomplishment(self):
         try:
-            _ = WebDriverWait(self.driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
-                expected_conditions.presence_of_element_located(
-                    (
-                        By.XPATH,
-                        "//*[@class='pv-profile-section pv-accomplishments-section artdeco-container-card artdeco-card ember-view']",
-                    )
-                )
-            )
-            acc = self.driver.find_element(By.XPATH,
+            acc = self.find_optional_element(By.XPATH,
                 "//*[@class='pv-profile-section pv-accomplishments-section artdeco-container-card artdeco-card ember-view']"
             )
+            if acc is None:
+                return
             for block in acc.find_elements(By.XPATH,
                 "//div[@class='pv-accomplishments-block__content break-words']"
             ):
@@ -334,7 +346,7 @@ class Person(Scraper):
                 for title in block.find_element(By.TAG_NAME,
                     "ul"
                 ).find_elements(By.TAG_NAME, "li"):
-                    accomplishment = Accomplishment(category.text, title.text)
+                    accomplishment = Accomplishment(category=category.text, title=title.text)
                     self.accomplishments.append(accomplishment)
         except:
             print("error in finding accomplishment......")
@@ -342,10 +354,7 @@ class Person(Scraper):
     def get_connections(self):
         try:
             self.driver.get("https://www.linkedin.com/mynetwork/invite-connect/connections/")
-            _ = WebDriverWait(self.driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
-                expected_conditions.presence_of_element_located((By.CLASS_NAME, "mn-connections"))
-            )
-            connections = self.driver.find_element(By.CLASS_NAME, "mn-connections")
+            connections = self.find_optional_element(By.CLASS_NAME, "mn-connections")
             if connections is not None:
                 for conn in connections.find_elements(By.CLASS_NAME, "mn-connection-card"):
                     anchor = conn.find_element(By.CLASS_NAME, "mn-connection-card__link")
@@ -362,25 +371,29 @@ class Person(Scraper):
     def scrape_logged_in(self, close_on_complete=True):
         driver = self.driver
         duration = None
+        self.timings = {}
 
-        root = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
-            expected_conditions.presence_of_element_located(
-                (
-                    By.TAG_NAME,
-                    self.__TOP_CARD,
+        with self.timed("page_ready"):
+            root = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
+                expected_conditions.presence_of_element_located(
+                    (
+                        By.TAG_NAME,
+                        self.__TOP_CARD,
+                    )
                 )
             )
-        )
-        self.focus()
-        self.wait(5)
+            self.focus()
+            # Wait for the top card itself instead of sleeping a fixed 5 seconds
+            self.wait_for_element_to_load(by=By.XPATH, name="//*[@class='mt2 relative']//h1")
 
         # get name and location
-        self.get_name_and_location()
-
-        self.open_to_work = self.is_open_to_work()
+        with self.timed("name_and_location"):
+            self.get_name_and_location()
+            self.open_to_work = self.is_open_to_work()
 
         # get about
-        self.get_about()
+        with self.timed("about"):
+            self.get_about()
         driver.execute_script(
             "window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));"
         )
@@ -389,21 +402,29 @@ class Person(Scraper):
         )
 
         # get experience
-        self.get_experiences()
+        with self.timed("experiences"):
+            self.get_experiences()
 
         # get education
-        self.get_educations()
+        with self.timed("educations"):
+            self.get_educations()
 
-        driver.get(self.linkedin_url)
+        with self.timed("reload_profile"):
+            driver.get(self.linkedin_url)
 
         # get interest
-        self.get_interests()
+        with self.timed("interests"):
+            self.get_interests()
         
         # get accomplishment
-        self.get_accomplishment()
+        with self.timed("accomplishments"):
+            self.get_accomplishment()
 
         # get connections
-        self.get_connections()
+        with self.timed("connections"):
+            self.get_connections()
+
+        print("Section timings: " + ", ".join(f"{section}={seconds:.2f}s" for section, seconds in self.timings.items()))
 
         if close_on_complete:
-            driver.quit()
\ No newline at end of file
+            driver.quit()
@@ -1,29 +1,28 @@
 import streamlit as st
 import os
-import google.generativeai as genai
-from dotenv import load_dotenv
 
 # from LinkedIn_Scrapper.main import scrape_profile
-# from helper import load_users, save_users, sanitize_filename
 
-from constants import USERS_FILE, SCRAPED_DATA_DIR, JDS_DIR
+from constants import JDS_DIR
+import gemini_client
+import metrics
 
 from pages.login_page import login_page, signup_page
 from pages.setup_profile_page import setup_profile_page
 from pages.apply_for_job_page import apply_for_roles_page
+from pages.recruiter_page import recruiter_page
+from user_store import is_recruiter
 
 # --- Configuration and Initialization ---
-load_dotenv()
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-
-if GEMINI_API_KEY:
-    genai.configure(api_key=GEMINI_API_KEY)
-else:
+if not gemini_client.configure():
     st.error("Gemini API Key not found. Please set GEMINI_API_KEY in your .env file.")
     st.stop()
 
+# Optional metrics endpoint / JSON dump / profiler, from METRICS_PORT etc. (see metrics.py)
+metrics.configure_from_env()
+PAGE_RENDER_SECONDS = metrics.histogram("page_render_seconds", "Time to run one Streamlit page script, by page.")
+
 # Ensure directories exist
-os.makedirs(SCRAPED_DATA_DIR, exist_ok=True)
 os.makedirs(JDS_DIR, exist_ok=True)
 
 # Initialize session state variables if they don't exist
@@ -39,6 +38,12 @@ def main():
     """Controls the page navigation based on session state."""
     st.set_page_config(page_title="AI Candidate Scorer", layout="wide") # Set app wide layout
 
+    page = st.session_state['page']
+    with metrics.span(f"page.{page}"), PAGE_RENDER_SECONDS.time(page=page):
+        render_page()
+
+def render_page():
+    """Renders the page selected in the session state."""
     if st.session_state['page'] == 'login':
         login_page()
     elif st.session_state['page'] == 'signup':
@@ -57,6 +62,13 @@ def main():
             st.rerun()
         else:
             apply_for_roles_page()
+    elif st.session_state['page'] == 'recruiter':
+        # Only logged-in recruiters may see applicant scores
+        if not st.session_state['logged_in'] or not is_recruiter(st.session_state['current_user']):
+            st.session_state['page'] = 'login'
+            st.rerun()
+        else:
+            recruiter_page()
 
 # Entry point of the Streamlit application
 if __name__ == "__main__":
@@ -1,3 +1,80 @@
+# Legacy JSON user file, imported once into the user store
 USERS_FILE = "users.json"
+USERS_DB_FILE = "users.db"
+# Legacy directory of per-profile JSON files, imported once into the profile store
 SCRAPED_DATA_DIR = "scraped_data"
-JDS_DIR = "JDs"
\ No newline at end of file
+PROFILES_DB_FILE = "profiles.db"
+# Scraped profiles older than this are re-scraped by profile_freshness.py and on profile setup
+PROFILE_TTL_SECONDS = 30 * 24 * 60 * 60
+JDS_DIR = "JDs"
+# Minimum seconds between re-scans of JDS_DIR by the in-memory JD catalogue
+JD_CATALOG_REFRESH_INTERVAL = 2.0
+# JDs shown per page on the apply page ("Show more" reveals the next page)
+JD_PAGE_SIZE = 10
+# Legacy CSV of applications, imported once into the application store
+USER_INPUTS_FILE = "./user_inputs.csv"
+APPLICATIONS_DB_FILE = "applications.db"
+# Page sizes offered on the recruiter leaderboard page
+LEADERBOARD_PAGE_SIZES = (25, 50, 100)
+# Seconds after which an application claimed by a scorer that never finished is claimed again
+APPLICATION_CLAIM_TIMEOUT = 600
+
+# Maximum number of Gemini scoring requests kept in flight by score_candidates.py
+SCORING_CONCURRENCY = 8
+# Number of applicants to the same JD scored together in one prompt (1 = one prompt per candidate)
+SCORING_GROUP_SIZE = 1
+# Attempts per scoring request (first try included) when Gemini's reply is missing or invalid,
+# with SCORING_RETRY_BACKOFF * attempt seconds between them
+SCORING_MAX_ATTEMPTS = 3
+SCORING_RETRY_BACKOFF = 1.0
+
+# Long-running scoring worker (scoring_worker.py)
+WORKER_POLL_INTERVAL = 1.0
+WORKER_BATCH_SIZE = 64
+# Seconds between passes that retry older applications which previously failed to score
+WORKER_RETRY_INTERVAL = 300
+WORKER_CHECKPOINT_FILE = "scoring_worker_checkpoint.json"
+WORKER_STATS_FILE = "scoring_worker_stats.json"
+
+# Default scoring model and generation config; GEMINI_MODEL_NAME in the environment overrides the model
+GEMINI_MODEL_NAME = "gemini-2.5-flash"
+GEMINI_GENERATION_CONFIG = {}
+
+# Local TF-IDF retrieval index (retrieval_index.py): hashed feature dimension, minimum seconds
+# between checks for new profiles / JDs, and number of per-candidate JD rankings kept (LRU)
+RETRIEVAL_HASH_DIM = 2048
+RETRIEVAL_SYNC_INTERVAL = 2.0
+RETRIEVAL_RANKING_CACHE_SIZE = 5000
+
+# Token budgets for the data embedded in each scoring prompt (see prompt_builder.py)
+PROMPT_CANDIDATE_TOKEN_BUDGET = 2000
+PROMPT_JD_TOKEN_BUDGET = 1000
+
+# LLM used for scoring: "gemini", or "mock" for the local stand-in in llm_backend.py. The mock's
+# defaults: seconds per call (+/- jitter fraction), probability of a server error / unparseable
+# reply, and calls per second before it answers 429 (0 = unlimited)
+LLM_BACKEND = "gemini"
+MOCK_LLM_LATENCY = 0.5
+MOCK_LLM_JITTER = 0.2
+MOCK_LLM_ERROR_RATE = 0.0
+MOCK_LLM_INVALID_RATE = 0.0
+MOCK_LLM_RATE_LIMIT = 0
+
+# Persistent cache of Gemini scores keyed on (JD, candidate profile, prompt, model)
+SCORE_CACHE_FILE = "score_cache.db"
+SCORE_CACHE_MAX_ENTRIES = 100_000
+
+# Background job queue (job_queue.py / job_worker.py)
+JOBS_DB_FILE = "jobs.db"
+JOB_POLL_INTERVAL = 1.0
+# Running jobs older than this are assumed to belong to a crashed worker and are run again
+JOB_STALE_TIMEOUT = 900
+# Seconds between status polls by a page waiting on a job
+JOB_STATUS_REFRESH_INTERVAL = 2
+# A page stops waiting on a job that no worker has picked up within this many seconds
+JOB_QUEUED_TIMEOUT = 60
+
+# Instrumentation (metrics.py): number of recent spans kept for the JSON dump, and the
+# sampling profiler's interval in seconds
+METRICS_TRACE_BUFFER = 1000
+PROFILER_SAMPLE_INTERVAL = 0.005
@@ -0,0 +1,65 @@
+import os
+import threading
+
+import google.generativeai as genai
+from dotenv import load_dotenv
+
+from constants import GEMINI_MODEL_NAME, GEMINI_GENERATION_CONFIG
+
+
+# --- Shared Gemini client ---
+# The API key is configured once per process and a single GenerativeModel is reused by every
+# scoring path. The underlying generative client (and its gRPC channel / HTTP session) is
+# created by the SDK on first use and shared by all requests made through the model.
+_lock = threading.Lock()
+_configured = False
+_model = None
+# Read from GEMINI_MODEL_NAME (environment / .env file) by configure(), unless set_model_config() set it first
+_model_name = None
+_generation_config = dict(GEMINI_GENERATION_CONFIG)
+
+
+def configure():
+    """
+    Configures the Gemini SDK with GEMINI_API_KEY (and the model name with GEMINI_MODEL_NAME)
+    from the environment / .env file. Safe to call repeatedly; returns True if an API key was found.
+    """
+    global _configured, _model_name
+    with _lock:
+        if _configured:
+            return True
+        load_dotenv()
+        if _model_name is None:
+            _model_name = os.getenv("GEMINI_MODEL_NAME", GEMINI_MODEL_NAME)
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            return False
+        genai.configure(api_key=api_key, transport=os.getenv("GEMINI_TRANSPORT") or None)
+        _configured = True
+        return True
+
+def set_model_config(model_name=None, generation_config=None):
+    """Overrides the model name and/or generation config. The shared model is rebuilt on next use."""
+    global _model, _model_name, _generation_config
+    with _lock:
+        if model_name is not None:
+            _model_name = model_name
+        if generation_config is not None:
+            _generation_config = dict(generation_config)
+        _model = None
+
+def get_model_name():
+    """Returns the name of the model used for scoring."""
+    if _model_name is None:
+        configure()
+    return _model_name
+
+def get_model():
+    """Returns the shared GenerativeModel, creating it on first use."""
+    global _model
+    if _model is None:
+        configure()
+        with _lock:
+            if _model is None:
+                _model = genai.GenerativeModel(_model_name, generation_config=_generation_config or None)
+    return _model
@@ -0,0 +1,119 @@
+import json
+import os
+import threading
+import time
+
+from constants import JDS_DIR, JD_CATALOG_REFRESH_INTERVAL
+
+
+class JDCatalog:
+    """
+    In-memory index of the parsed Job Descriptions in a directory.
+    Files are only re-parsed when their mtime or size changes, and the directory is re-scanned
+    at most once every refresh_interval seconds, so repeated lookups (e.g. on every Streamlit
+    rerun) cost no file I/O. The returned JD dicts are shared and must not be modified.
+    """
+
+    def __init__(self, directory=JDS_DIR, refresh_interval=JD_CATALOG_REFRESH_INTERVAL):
+        self.directory = directory
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._entries = {}  # filename -> (mtime_ns, size, data)
+        self._errors = {}  # filename -> (mtime_ns, size) of files that failed to parse
+        self._jds = []
+        self._last_scan = None
+        self._directory_mtime_ns = None
+        self.version = 0
+
+    def _read_directory_mtime_ns(self):
+        """mtime of the directory itself, which changes whenever a file is added, removed or renamed."""
+        try:
+            return os.stat(self.directory).st_mtime_ns
+        except OSError:
+            return None
+
+    def refresh(self, force=False):
+        """Re-scans the directory and re-parses new or modified files. Returns True if anything changed."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._last_scan is not None and now - self._last_scan < self.refresh_interval:
+                return False
+            self._last_scan = now
+            self._directory_mtime_ns = self._read_directory_mtime_ns()
+
+            seen = {}
+            if os.path.isdir(self.directory):
+                with os.scandir(self.directory) as it:
+                    for entry in it:
+                        if entry.name.endswith(".json") and entry.is_file():
+                            stat = entry.stat()
+                            seen[entry.name] = (stat.st_mtime_ns, stat.st_size)
+
+            changed = False
+            for filename in list(self._entries):
+                if filename not in seen:
+                    del self._entries[filename]
+                    changed = True
+            for filename in list(self._errors):
+                if filename not in seen:
+                    del self._errors[filename]
+                    changed = True
+
+            for filename, signature in seen.items():
+                entry = self._entries.get(filename)
+                if entry is not None and entry[:2] == signature:
+                    continue
+                if self._errors.get(filename) == signature:
+                    continue
+                try:
+                    with open(os.path.join(self.directory, filename), 'r') as f:
+                        data = json.load(f)
+                except (OSError, json.JSONDecodeError):
+                    self._entries.pop(filename, None)
+                    self._errors[filename] = signature
+                else:
+                    self._entries[filename] = (signature[0], signature[1], data)
+                    self._errors.pop(filename, None)
+                changed = True
+
+            if changed:
+                self._jds = [
+                    {"filename": filename, "data": self._entries[filename][2]}
+                    for filename in sorted(self._entries)
+                ]
+                self.version += 1
+            return changed
+
+    def list_jds(self):
+        """Returns all valid JDs as a list of {"filename", "data"} dicts, ordered by filename."""
+        self.refresh()
+        return self._jds
+
+    def get(self, filename):
+        """Returns the parsed JD for filename, or None if it does not exist or is malformed."""
+        self.refresh()
+        entry = self._entries.get(filename)
+        if entry is None and self._read_directory_mtime_ns() != self._directory_mtime_ns:
+            # The file may have been added since the last scan. Unknown names (e.g. a stale filename
+            # on an application) only cost a stat of the directory until its contents change
+            self.refresh(force=True)
+            entry = self._entries.get(filename)
+        return entry[2] if entry is not None else None
+
+    def malformed_files(self):
+        """Returns the names of JD files that could not be parsed."""
+        self.refresh()
+        return sorted(self._errors)
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+def get_jd_catalog():
+    """Returns the process-wide JD catalogue for JDS_DIR."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = JDCatalog()
+    return _catalog
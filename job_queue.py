@@ -0,0 +1,133 @@
+import json
+import sqlite3
+import threading
+import time
+import uuid
+
+from constants import JOBS_DB_FILE, JOB_STALE_TIMEOUT
+
+
+# Job status lifecycle: queued -> running (claimed by a worker) -> done | failed
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# Job kinds
+SCRAPE_PROFILE = "scrape_profile"
+
+
+class JobQueue:
+    """
+    Persistent background job queue backed by SQLite.
+    The Streamlit app submits jobs and polls their status by id; a separate worker process
+    (job_worker.py) claims and runs them, so slow work never blocks a page render.
+    """
+
+    def __init__(self, path=JOBS_DB_FILE):
+        self.path = path
+        self._local = threading.local()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id TEXT PRIMARY KEY,"
+                " kind TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " status TEXT NOT NULL,"
+                " error TEXT,"
+                " created_at REAL NOT NULL,"
+                " started_at REAL,"
+                " finished_at REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+
+    def _connect(self):
+        """Returns this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def submit(self, kind, payload):
+        """
+        Queues a job and returns its id. If an identical job is already queued or running,
+        its id is returned instead, so repeated submits (e.g. Streamlit reruns) do not pile up.
+        """
+        payload_json = json.dumps(payload, sort_keys=True)
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE kind = ? AND payload = ? AND status IN (?, ?)",
+                (kind, payload_json, QUEUED, RUNNING),
+            ).fetchone()
+            if row is not None:
+                return row["id"]
+            job_id = uuid.uuid4().hex
+            conn.execute(
+                "INSERT INTO jobs (id, kind, payload, status, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, kind, payload_json, QUEUED, time.time()),
+            )
+        return job_id
+
+    def get(self, job_id):
+        """Returns the job as a dict (with the payload decoded), or None if unknown."""
+        row = self._connect().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        return job
+
+    def claim_next(self, stale_timeout=JOB_STALE_TIMEOUT):
+        """
+        Atomically claims the oldest queued job (or a running job older than stale_timeout seconds,
+        left behind by a crashed worker). Returns it as a dict, or None if there is nothing to do.
+        """
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = ? OR (status = ? AND started_at < ?)"
+                " ORDER BY created_at LIMIT 1",
+                (QUEUED, RUNNING, now - stale_timeout),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE jobs SET status = ?, started_at = ? WHERE id = ?", (RUNNING, now, row["id"]))
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["status"] = RUNNING
+        return job
+
+    def finish(self, job_id, error=None):
+        """Marks a job done, or failed with the given error message."""
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                (FAILED if error else DONE, error, time.time(), job_id),
+            )
+
+    def count_by_status(self):
+        """Returns a dict mapping each status to its number of jobs."""
+        rows = self._connect().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+def get_job_queue():
+    """Returns the process-wide job queue."""
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = JobQueue()
+    return _queue
@@ -0,0 +1,64 @@
+import argparse
+import time
+import traceback
+
+from constants import JOB_POLL_INTERVAL
+from job_queue import get_job_queue, SCRAPE_PROFILE
+from profile_freshness import refresh_profile
+import metrics
+
+JOBS = metrics.counter("jobs_total", "Background jobs run, by kind and outcome.")
+JOB_SECONDS = metrics.histogram("job_seconds", "Run time of background jobs, by kind.")
+
+
+def run_scrape_profile(payload):
+    """Scrapes (or refreshes) one candidate's LinkedIn profile."""
+    refresh_profile(payload["linkedin_url"])
+
+JOB_HANDLERS = {
+    SCRAPE_PROFILE: run_scrape_profile,
+}
+
+
+def run_job(queue, job):
+    """Runs one claimed job and records its outcome."""
+    handler = JOB_HANDLERS.get(job["kind"])
+    if handler is None:
+        queue.finish(job["id"], error=f"Unknown job kind: {job['kind']}")
+        return
+    print(f"Running {job['kind']} job {job['id']}: {job['payload']}")
+    try:
+        with metrics.span(f"job.{job['kind']}"), JOB_SECONDS.time(kind=job["kind"]):
+            handler(job["payload"])
+    except Exception as e:
+        traceback.print_exc()
+        JOBS.inc(kind=job["kind"], status="failed")
+        queue.finish(job["id"], error=str(e) or e.__class__.__name__)
+    else:
+        JOBS.inc(kind=job["kind"], status="done")
+        queue.finish(job["id"])
+        print(f"Finished job {job['id']}")
+
+def run_forever(poll_interval=JOB_POLL_INTERVAL):
+    """Runs queued jobs one at a time until interrupted."""
+    queue = get_job_queue()
+    print(f"Job worker started. Queue: {queue.count_by_status()}")
+    try:
+        while True:
+            job = queue.claim_next()
+            if job is None:
+                time.sleep(poll_interval)
+                continue
+            run_job(queue, job)
+    except KeyboardInterrupt:
+        print("Job worker stopped")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run background jobs (profile scraping) submitted by the Streamlit app.")
+    parser.add_argument("--poll-interval", type=float, default=JOB_POLL_INTERVAL, help="Seconds to wait between polls when idle.")
+    metrics.add_arguments(parser)
+    args = parser.parse_args()
+    metrics.configure_from_args(args)
+
+    run_forever(poll_interval=args.poll_interval)
@@ -0,0 +1,226 @@
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+
+import google.generativeai as genai
+from dotenv import load_dotenv
+
+from constants import LLM_BACKEND, MOCK_LLM_LATENCY, MOCK_LLM_JITTER, MOCK_LLM_ERROR_RATE, MOCK_LLM_INVALID_RATE, MOCK_LLM_RATE_LIMIT
+from prompt_builder import estimate_tokens
+import gemini_client
+
+
+# --- LLM Backends ---
+# score_candidates.py talks to the model only through get_backend().generate(prompt, response_schema).
+# GeminiBackend is the production implementation; MockBackend is a local stand-in with configurable
+# latency, error rate and 429 behaviour that replays recorded responses or synthesises valid scores,
+# so the scoring pipeline can be benchmarked and load-tested without quota or network.
+#
+#   LLM_BACKEND=mock MOCK_LLM_LATENCY=0.8 MOCK_LLM_RATE_LIMIT=20 python scoring_worker.py
+#   python load_test.py --concurrency 1,4,8,16 --latency 0.8 --rate-limit 20
+
+
+class LLMError(Exception):
+    """A failed model call (network error, server error, blocked or empty reply)."""
+
+class RateLimitError(LLMError):
+    """The backend rejected the call for exceeding its rate limit or quota (HTTP 429)."""
+
+
+class LLMResponse:
+    """Text of a model reply with the token usage reported for the call (None if unknown)."""
+
+    def __init__(self, text, prompt_tokens=None, output_tokens=None):
+        self.text = text
+        self.prompt_tokens = prompt_tokens
+        self.output_tokens = output_tokens
+
+
+def prompt_digest(prompt):
+    """Key of a prompt in recorded-response files."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+class GeminiBackend:
+    """
+    Scores with the shared Gemini model (see gemini_client.py). With record_file set, every reply is
+    appended to it as a JSON line, so MockBackend can replay real responses later.
+    """
+
+    name = "gemini"
+
+    def __init__(self, record_file=None):
+        self.record_file = record_file
+        self._record_lock = threading.Lock()
+
+    @property
+    def model_name(self):
+        return gemini_client.get_model_name()
+
+    def generate(self, prompt, response_schema=None):
+        generation_config = None
+        if response_schema is not None:
+            generation_config = genai.GenerationConfig(response_mime_type="application/json", response_schema=response_schema)
+        try:
+            response = gemini_client.get_model().generate_content([prompt], generation_config=generation_config)
+            text = response.text
+        except Exception as e:
+            # google.api_core.exceptions.ResourceExhausted is the SDK's HTTP 429
+            if e.__class__.__name__ in ("ResourceExhausted", "TooManyRequests"):
+                raise RateLimitError(str(e)) from e
+            raise LLMError(str(e)) from e
+
+        usage = getattr(response, "usage_metadata", None)
+        result = LLMResponse(
+            text,
+            prompt_tokens=getattr(usage, "prompt_token_count", None) if usage else None,
+            output_tokens=getattr(usage, "candidates_token_count", None) if usage else None,
+        )
+        if self.record_file:
+            with self._record_lock, open(self.record_file, 'a') as f:
+                f.write(json.dumps({"prompt_sha256": prompt_digest(prompt), "text": text}) + "\n")
+        return result
+
+
+class MockBackend:
+    """
+    Local stand-in for the model. Each call sleeps for latency seconds (+/- jitter as a fraction),
+    then fails with probability error_rate, returns unparseable text with probability invalid_rate,
+    and raises RateLimitError when calls exceed rate_limit per second (token bucket, one second of
+    burst). Otherwise it returns the recorded reply for the prompt from replay_file if there is one,
+    or a deterministic reply synthesised from the response schema.
+    """
+
+    name = "mock"
+    model_name = "mock"
+
+    def __init__(
+        self,
+        latency=MOCK_LLM_LATENCY,
+        jitter=MOCK_LLM_JITTER,
+        error_rate=MOCK_LLM_ERROR_RATE,
+        invalid_rate=MOCK_LLM_INVALID_RATE,
+        rate_limit=MOCK_LLM_RATE_LIMIT,
+        replay_file=None,
+        seed=None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.invalid_rate = invalid_rate
+        self.rate_limit = rate_limit
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = float(rate_limit or 0)
+        self._tokens_updated_at = time.monotonic()
+        self._replies = {}
+        if replay_file:
+            with open(replay_file, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        self._replies[record["prompt_sha256"]] = record["text"]
+
+    def _take_rate_limit_token(self):
+        """Returns False if this call exceeds the configured rate limit."""
+        if not self.rate_limit:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate_limit, self._tokens + (now - self._tokens_updated_at) * self.rate_limit)
+            self._tokens_updated_at = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def generate(self, prompt, response_schema=None):
+        if not self._take_rate_limit_token():
+            raise RateLimitError("429 Resource has been exhausted (mock rate limit)")
+        with self._lock:
+            delay = self.latency * (1 + self.jitter * (2 * self._random.random() - 1))
+            roll = self._random.random()
+        time.sleep(max(0.0, delay))
+
+        if roll < self.error_rate:
+            raise LLMError("500 Internal error (mock)")
+        if roll < self.error_rate + self.invalid_rate:
+            text = "score: 85/100"
+        else:
+            text = self._replies.get(prompt_digest(prompt))
+            if text is None:
+                text = json.dumps(synthesize(response_schema, prompt))
+        return LLMResponse(text, prompt_tokens=estimate_tokens(prompt), output_tokens=estimate_tokens(text))
+
+
+_ARRAY_LENGTH_RE = re.compile(r"JSON array of (\d+)")
+
+def synthesize(schema, prompt, path="", index=None):
+    """
+    Builds a value matching a response schema. Integers are derived from a hash of the prompt and
+    their path in the reply, so the same prompt always gets the same scores. Arrays get the length
+    the prompt asks for ("JSON array of N ..."), and an integer 'candidate' field is its item's index.
+    """
+    schema = schema or {"type": "string"}
+    kind = schema.get("type")
+    if kind == "object":
+        return {
+            name: synthesize(subschema, prompt, f"{path}.{name}", index)
+            for name, subschema in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        match = _ARRAY_LENGTH_RE.search(prompt)
+        length = int(match.group(1)) if match else 1
+        return [synthesize(schema.get("items"), prompt, f"{path}[{i}]", i) for i in range(length)]
+    if kind == "integer":
+        if path.endswith(".candidate") and index is not None:
+            return index
+        return int(prompt_digest(f"{path}\0{prompt}")[:8], 16) % 101
+    if kind == "number":
+        return (int(prompt_digest(f"{path}\0{prompt}")[:8], 16) % 10001) / 100
+    if kind == "boolean":
+        return int(prompt_digest(f"{path}\0{prompt}")[:2], 16) % 2 == 0
+    return "mock"
+
+
+def backend_from_env():
+    """Builds the backend selected by LLM_BACKEND (gemini / mock) and the MOCK_LLM_* / GEMINI_RECORD_FILE variables."""
+    load_dotenv()
+    name = os.getenv("LLM_BACKEND", LLM_BACKEND)
+    if name == "mock":
+        return MockBackend(
+            latency=float(os.getenv("MOCK_LLM_LATENCY", MOCK_LLM_LATENCY)),
+            jitter=float(os.getenv("MOCK_LLM_JITTER", MOCK_LLM_JITTER)),
+            error_rate=float(os.getenv("MOCK_LLM_ERROR_RATE", MOCK_LLM_ERROR_RATE)),
+            invalid_rate=float(os.getenv("MOCK_LLM_INVALID_RATE", MOCK_LLM_INVALID_RATE)),
+            rate_limit=float(os.getenv("MOCK_LLM_RATE_LIMIT", MOCK_LLM_RATE_LIMIT)),
+            replay_file=os.getenv("MOCK_LLM_REPLAY_FILE") or None,
+        )
+    if name == "gemini":
+        if not gemini_client.configure():
+            print("Gemini API Key not found. Please set GEMINI_API_KEY in your .env file.")
+        return GeminiBackend(record_file=os.getenv("GEMINI_RECORD_FILE") or None)
+    raise ValueError(f"Unknown LLM_BACKEND: {name}")
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+def get_backend():
+    """Returns the process-wide LLM backend, creating it from the environment on first use."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = backend_from_env()
+    return _backend
+
+def set_backend(backend):
+    """Replaces the process-wide LLM backend (e.g. with a MockBackend for a load test)."""
+    global _backend
+    with _backend_lock:
+        _backend = backend
@@ -0,0 +1,150 @@
+import argparse
+import contextlib
+import io
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from constants import (
+    SCORING_CONCURRENCY, SCORING_GROUP_SIZE, MOCK_LLM_LATENCY, MOCK_LLM_JITTER,
+    MOCK_LLM_ERROR_RATE, MOCK_LLM_INVALID_RATE, MOCK_LLM_RATE_LIMIT,
+)
+from jd_catalog import get_jd_catalog
+from llm_backend import MockBackend, set_backend
+from score_candidates import score_candidates_for_jd, LLM_REQUESTS
+import metrics
+
+
+# End-to-end throughput test of the scoring pipeline against the local mock LLM backend.
+# Synthetic candidates are scored against the JD catalogue through the same path as the scorer
+# (prompt compaction, structured output, parsing, retries, group fallback), with the score cache
+# bypassed, once per combination of concurrency and group size:
+#
+#   python load_test.py --candidates 200 --concurrency 1,4,8,16 --group-size 1,5 --latency 0.8 --rate-limit 10
+
+SKILLS = [
+    "Python", "Java", "SQL", "Git", "Docker", "Kubernetes", "AWS", "Machine Learning",
+    "Data Structures & Algorithms", "JavaScript", "React", "Spark", "Statistics", "REST APIs",
+]
+DEGREES = ["Bachelor of Technology", "Master of Science", "Bachelor of Engineering", "PhD"]
+
+
+def synthetic_candidate(i, rng):
+    """A scraped-profile-shaped candidate with a few experiences, educations and skills."""
+    skills = rng.sample(SKILLS, 5)
+    return {
+        "linkedin_url": f"https://www.linkedin.com/in/load-test-{i}/",
+        "name": f"Candidate {i}",
+        "about": f"Engineer with experience in {', '.join(skills)}.",
+        "experiences": [
+            {
+                "position_title": rng.choice(["Software Engineer", "Data Scientist", "Backend Developer"]),
+                "institution_name": f"Company {rng.randrange(100)}",
+                "duration": f"{rng.randrange(1, 6)} yrs {rng.randrange(12)} mos",
+                "description": f"Built services using {skill}.",
+            }
+            for skill in skills[:3]
+        ],
+        "educations": [{"institution_name": f"University {rng.randrange(50)}", "degree": rng.choice(DEGREES)}],
+        "interests": [],
+        "accomplishments": [],
+    }
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def run(jds, candidates, concurrency, group_size):
+    """
+    Scores every candidate against a JD from the catalogue (round robin), in groups of group_size,
+    with at most concurrency groups in flight. Returns a dict of throughput and latency figures.
+    """
+    groups = []
+    for start in range(0, len(candidates), group_size):
+        jd = jds[(start // group_size) % len(jds)]["data"]
+        groups.append((jd, candidates[start:start + group_size]))
+
+    def score_group(jd, group):
+        start = time.perf_counter()
+        scores = score_candidates_for_jd(jd, group, use_cache=False)
+        return time.perf_counter() - start, scores
+
+    counters_before = (
+        LLM_REQUESTS.value(backend="mock", status="ok"),
+        LLM_REQUESTS.value(backend="mock", status="error"),
+        LLM_REQUESTS.value(backend="mock", status="rate_limited"),
+    )
+    latencies = []
+    scored = failed = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(score_group, jd, group) for jd, group in groups]
+        for future in as_completed(futures):
+            latency, scores = future.result()
+            latencies.append(latency)
+            scored += sum(score is not None for score in scores)
+            failed += sum(score is None for score in scores)
+    elapsed = time.perf_counter() - start
+    ok, errors, rate_limited = (
+        LLM_REQUESTS.value(backend="mock", status=status) - before
+        for status, before in zip(("ok", "error", "rate_limited"), counters_before)
+    )
+    return {
+        "concurrency": concurrency,
+        "group_size": group_size,
+        "seconds": elapsed,
+        "candidates_per_second": len(candidates) / elapsed,
+        "p50": percentile(latencies, 0.5),
+        "p95": percentile(latencies, 0.95),
+        "calls": ok + errors + rate_limited,
+        "errors": errors,
+        "rate_limited": rate_limited,
+        "scored": scored,
+        "failed": failed,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure scoring throughput against the local mock LLM backend.")
+    parser.add_argument("--candidates", type=int, default=100, help="Number of synthetic candidates scored per run.")
+    parser.add_argument("--concurrency", default=str(SCORING_CONCURRENCY), help="Comma-separated concurrency levels to try.")
+    parser.add_argument("--group-size", default=str(SCORING_GROUP_SIZE), help="Comma-separated group sizes to try.")
+    parser.add_argument("--latency", type=float, default=MOCK_LLM_LATENCY, help="Mock seconds per call.")
+    parser.add_argument("--jitter", type=float, default=MOCK_LLM_JITTER, help="Mock latency jitter, as a fraction of --latency.")
+    parser.add_argument("--error-rate", type=float, default=MOCK_LLM_ERROR_RATE, help="Probability of a mock server error.")
+    parser.add_argument("--invalid-rate", type=float, default=MOCK_LLM_INVALID_RATE, help="Probability of an unparseable mock reply.")
+    parser.add_argument("--rate-limit", type=float, default=MOCK_LLM_RATE_LIMIT, help="Mock calls per second before it answers 429 (0 = unlimited).")
+    parser.add_argument("--replay-file", default=None, help="JSON lines of recorded replies (see GEMINI_RECORD_FILE) to answer with.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic candidates and the mock's randomness.")
+    parser.add_argument("--verbose", action="store_true", help="Show the scorer's per-request output.")
+    metrics.add_arguments(parser)
+    args = parser.parse_args()
+    metrics.configure_from_args(args)
+
+    jds = get_jd_catalog().list_jds()
+    if not jds:
+        parser.error("The JD catalogue is empty; add JD files to score against.")
+    rng = random.Random(args.seed)
+    candidates = [synthetic_candidate(i, rng) for i in range(args.candidates)]
+
+    print(f"{'concurrency':>11} {'group':>5} {'seconds':>8} {'cand/s':>8} {'p50':>7} {'p95':>7} {'calls':>6} {'errors':>6} {'429s':>6} {'failed':>6}")
+    for group_size in (int(value) for value in args.group_size.split(",")):
+        for concurrency in (int(value) for value in args.concurrency.split(",")):
+            # A fresh mock per run, so each run starts with a full rate-limit bucket
+            set_backend(MockBackend(
+                latency=args.latency,
+                jitter=args.jitter,
+                error_rate=args.error_rate,
+                invalid_rate=args.invalid_rate,
+                rate_limit=args.rate_limit,
+                replay_file=args.replay_file,
+                seed=args.seed,
+            ))
+            with contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO()):
+                result = run(jds, candidates, concurrency, group_size)
+            print(
+                f"{result['concurrency']:>11} {result['group_size']:>5} {result['seconds']:>8.2f} "
+                f"{result['candidates_per_second']:>8.1f} {result['p50']:>7.2f} {result['p95']:>7.2f} "
+                f"{result['calls']:>6} {result['errors']:>6} {result['rate_limited']:>6} {result['failed']:>6}"
+            )
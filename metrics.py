@@ -0,0 +1,354 @@
+import atexit
+import bisect
+import contextvars
+import cProfile
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import deque, Counter as TallyCounter
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from constants import METRICS_TRACE_BUFFER, PROFILER_SAMPLE_INTERVAL
+
+
+# --- Instrumentation ---
+# Process-wide counters, latency histograms and nested timing spans for the scraping and scoring
+# hot paths. Everything is in memory; configure() optionally exposes it on a local Prometheus-style
+# text endpoint (/metrics, plus /metrics.json), dumps a JSON snapshot at exit, and profiles the run.
+#
+#   METRICS_PORT=9464 streamlit run app.py
+#   python scoring_worker.py --metrics-port 9464 --metrics-json metrics.json --profile worker.prof
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+TOKEN_BUCKETS = (100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+
+_lock = threading.Lock()
+_metrics = {}  # name -> Counter / Histogram
+_recent_spans = deque(maxlen=METRICS_TRACE_BUFFER)
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+
+def _label_key(labels):
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_labels(label_key, extra=()):
+    pairs = list(label_key) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+class Counter:
+    """A monotonically increasing count, one series per label combination."""
+
+    type = "counter"
+
+    def __init__(self, name, help):
+        self.name = name
+        self.help = help
+        self._values = {}
+
+    def inc(self, amount=1, **labels):
+        key = _label_key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(_label_key(labels), 0)
+
+    def prometheus_lines(self):
+        return [f"{self.name}{_format_labels(key)} {value}" for key, value in sorted(self._values.items())]
+
+    def to_json(self):
+        return [{"labels": dict(key), "value": value} for key, value in sorted(self._values.items())]
+
+
+class Histogram:
+    """Distribution of observed values (e.g. latencies in seconds) over fixed cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(self, name, help, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}  # label key -> [bucket counts..., sum, count]
+
+    def observe(self, value, **labels):
+        key = _label_key(labels)
+        with _lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * len(self.buckets) + [0.0, 0]
+            bucket = bisect.bisect_left(self.buckets, value)
+            if bucket < len(self.buckets):
+                series[bucket] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observes the duration of the with-block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _cumulative(self, series):
+        counts, running = [], 0
+        for count in series[:len(self.buckets)]:
+            running += count
+            counts.append(running)
+        return counts
+
+    def prometheus_lines(self):
+        lines = []
+        for key, series in sorted(self._series.items()):
+            for bound, count in zip(self.buckets, self._cumulative(series)):
+                lines.append(f"{self.name}_bucket{_format_labels(key, [('le', repr(float(bound)))])} {count}")
+            lines.append(f"{self.name}_bucket{_format_labels(key, [('le', '+Inf')])} {series[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {series[-2]}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {series[-1]}")
+        return lines
+
+    def to_json(self):
+        return [
+            {
+                "labels": dict(key),
+                "count": series[-1],
+                "sum": series[-2],
+                "buckets": dict(zip((str(bound) for bound in self.buckets), self._cumulative(series))),
+            }
+            for key, series in sorted(self._series.items())
+        ]
+
+
+def _get_or_create(cls, name, help, **kwargs):
+    with _lock:
+        metric = _metrics.get(name)
+        if metric is None:
+            metric = _metrics[name] = cls(name, help, **kwargs)
+        elif not isinstance(metric, cls):
+            raise ValueError(f"Metric {name} is already registered as a {metric.type}")
+        return metric
+
+def counter(name, help=""):
+    """Returns the process-wide counter called name, creating it on first use."""
+    return _get_or_create(Counter, name, help)
+
+def histogram(name, help="", buckets=DEFAULT_BUCKETS):
+    """Returns the process-wide histogram called name, creating it on first use."""
+    return _get_or_create(Histogram, name, help, buckets=buckets)
+
+
+SPAN_SECONDS = histogram("span_seconds", "Duration of timing spans, labelled by their nesting path.")
+
+@contextmanager
+def span(name, **attributes):
+    """
+    Times a block as a span. Spans opened inside another span (in the same thread or task) are
+    nested under it: the histogram label is the full path, e.g. 'score_application_group/llm_request'.
+    Finished spans are also kept in a bounded buffer of recent traces for the JSON dump.
+    """
+    parent = _current_span.get()
+    path = f"{parent}/{name}" if parent else name
+    token = _current_span.set(path)
+    start_wall = time.time()
+    start = time.perf_counter()
+    error = None
+    try:
+        yield
+    except BaseException as e:
+        error = e.__class__.__name__
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        _current_span.reset(token)
+        SPAN_SECONDS.observe(duration, span=path)
+        record = {"span": path, "start": start_wall, "duration": duration, "thread": threading.current_thread().name}
+        if attributes:
+            record["attributes"] = {key: str(value) for key, value in attributes.items()}
+        if error:
+            record["error"] = error
+        _recent_spans.append(record)
+
+
+def render_prometheus():
+    """Renders every metric in the Prometheus text exposition format."""
+    lines = []
+    with _lock:
+        metrics = sorted(_metrics.items())
+    for name, metric in metrics:
+        if metric.help:
+            lines.append(f"# HELP {name} {metric.help}")
+        lines.append(f"# TYPE {name} {metric.type}")
+        lines.extend(metric.prometheus_lines())
+    return "\n".join(lines) + "\n"
+
+def snapshot():
+    """Returns every metric and the recent spans as a JSON-serialisable dict."""
+    with _lock:
+        metrics = sorted(_metrics.items())
+        spans = list(_recent_spans)
+    return {
+        "timestamp": time.time(),
+        "pid": os.getpid(),
+        "metrics": {name: {"type": metric.type, "help": metric.help, "series": metric.to_json()} for name, metric in metrics},
+        "recent_spans": spans,
+    }
+
+def dump_json(path):
+    """Writes snapshot() to path atomically."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(snapshot(), f, indent=4)
+    os.replace(tmp_path, path)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path in ("/metrics", "/"):
+            body, content_type = render_prometheus().encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8"
+        elif self.path == "/metrics.json":
+            body, content_type = json.dumps(snapshot()).encode("utf-8"), "application/json"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+_server = None
+
+def start_http_server(port, host="127.0.0.1"):
+    """Serves /metrics and /metrics.json on a background thread. Safe to call repeatedly."""
+    global _server
+    with _lock:
+        if _server is not None:
+            return _server
+        try:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        except OSError as e:
+            print(f"Could not start the metrics endpoint on {host}:{port}: {e}")
+            return None
+    threading.Thread(target=_server.serve_forever, name="metrics-http", daemon=True).start()
+    print(f"Serving metrics on http://{host}:{port}/metrics")
+    return _server
+
+
+class SamplingProfiler:
+    """
+    Low-overhead statistical profiler: a background thread snapshots the stacks of all threads every
+    interval seconds. Unlike cProfile it also sees work done in thread pools. Writes collapsed stacks
+    (one 'frame;frame;frame count' line per distinct stack), the input format of flame graph tools.
+    """
+
+    def __init__(self, interval=PROFILER_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks = TallyCounter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                    frame = frame.f_back
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self, path):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        with open(path, 'w') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        print(f"Wrote {sum(self.stacks.values())} profiler samples to {path}")
+
+def start_profiler(path, mode="cprofile"):
+    """
+    Profiles the rest of the run and writes the result to path at exit.
+    mode 'cprofile' records every call in the calling thread (pstats file; a summary is printed);
+    mode 'sample' samples all threads (collapsed stacks).
+    """
+    if mode == "sample":
+        profiler = SamplingProfiler()
+        profiler.start()
+        atexit.register(profiler.stop, path)
+        return profiler
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+    def finish():
+        profiler.disable()
+        profiler.dump_stats(path)
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+        print(f"Wrote cProfile stats to {path}")
+
+    atexit.register(finish)
+    return profiler
+
+
+_configured = False
+
+def configure(port=None, json_file=None, profile_file=None, profiler="cprofile"):
+    """
+    Enables the optional outputs for this run: the HTTP endpoint on port, a JSON dump to json_file
+    at exit and a profile written to profile_file. Only the first call in a process has any effect.
+    """
+    global _configured
+    with _lock:
+        if _configured:
+            return
+        _configured = True
+    if port:
+        start_http_server(int(port))
+    if json_file:
+        atexit.register(dump_json, json_file)
+    if profile_file:
+        start_profiler(profile_file, profiler)
+
+def configure_from_env():
+    """configure() from METRICS_PORT, METRICS_JSON_FILE, PROFILE_OUTPUT and PROFILER (cprofile / sample)."""
+    configure(
+        port=os.getenv("METRICS_PORT"),
+        json_file=os.getenv("METRICS_JSON_FILE"),
+        profile_file=os.getenv("PROFILE_OUTPUT"),
+        profiler=os.getenv("PROFILER", "cprofile"),
+    )
+
+def add_arguments(parser):
+    """Adds the --metrics-port / --metrics-json / --profile / --profiler options to a CLI."""
+    group = parser.add_argument_group("instrumentation")
+    group.add_argument("--metrics-port", type=int, default=os.getenv("METRICS_PORT"), help="Serve Prometheus-style metrics on this local port.")
+    group.add_argument("--metrics-json", default=os.getenv("METRICS_JSON_FILE"), help="Write a JSON dump of all metrics to this file at exit.")
+    group.add_argument("--profile", metavar="FILE", default=os.getenv("PROFILE_OUTPUT"), help="Profile this run and write the result to FILE.")
+    group.add_argument("--profiler", choices=("cprofile", "sample"), default=os.getenv("PROFILER", "cprofile"), help="cProfile (calling thread) or the sampling profiler (all threads).")
+
+def configure_from_args(args):
+    """configure() from the options added by add_arguments."""
+    configure(port=args.metrics_port, json_file=args.metrics_json, profile_file=args.profile, profiler=args.profiler)
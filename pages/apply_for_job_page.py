@@ -1,24 +1,31 @@
 import streamlit as st
-import os
-import json
-import pandas as pd
 
-from constants import USERS_FILE, SCRAPED_DATA_DIR, JDS_DIR
-from helper import load_users, sanitize_filename, save_users
+from constants import JDS_DIR, JD_PAGE_SIZE
+from user_store import get_user_store
+from jd_catalog import get_jd_catalog
+from application_store import get_application_store
+from retrieval_index import get_retrieval_index
+import metrics
 
 
-if not os.path.exists("./user_inputs.csv"):
-    df = pd.DataFrame(columns=["user_linkedin_url", "JD", "score"])
-    df.to_csv("./user_inputs.csv", index=False)
-
-user_inputs = pd.read_csv("./user_inputs.csv")
+def rank_jds(jds, user_linkedin_url):
+    """
+    Orders the JDs by how well they match the candidate's profile, best first.
+    JDs the retrieval index could not rank (e.g. before the profile is indexed) keep catalogue order at the end.
+    Returns (ordered JD filenames, {filename: similarity}).
+    """
+    ranking = get_retrieval_index().ranked_jds_for_candidate(user_linkedin_url)
+    similarities = dict(ranking)
+    ranked = [filename for filename, _ in ranking]
+    ranked.extend(jd['filename'] for jd in jds if jd['filename'] not in similarities)
+    return ranked, similarities
 
 
 def apply_for_roles_page():
     """Renders the page where users can view JDs and apply/get scores."""
     st.title("Apply for Roles")
 
-    current_user_data = load_users().get(st.session_state['current_user'])
+    current_user_data = get_user_store().get_user(st.session_state['current_user'])
     # Ensure user is logged in and has a LinkedIn URL in their profile
     if not current_user_data or not current_user_data.get('linkedin_url'):
         st.warning("Please complete your profile setup first.")
@@ -28,17 +35,11 @@ def apply_for_roles_page():
 
     st.markdown(f"Welcome, **{current_user_data.get('name', st.session_state['current_user'])}**! Select a job description to see your compatibility score.")
 
-    # Load all Job Descriptions from the JDS_DIR
-    jds = []
-    for filename in os.listdir(JDS_DIR):
-        if filename.endswith(".json"):
-            filepath = os.path.join(JDS_DIR, filename)
-            try:
-                with open(filepath, 'r') as f:
-                    jd_data = json.load(f)
-                    jds.append({"filename": filename, "data": jd_data})
-            except json.JSONDecodeError:
-                st.warning(f"Skipping malformed JD file: {filename}")
+    # Load all Job Descriptions from the in-memory JD catalogue (re-parsed only when files change)
+    jd_catalog = get_jd_catalog()
+    jds = jd_catalog.list_jds()
+    for filename in jd_catalog.malformed_files():
+        st.warning(f"Skipping malformed JD file: {filename}")
 
     if not jds:
         st.info(f"No Job Descriptions found in the '{JDS_DIR}' folder. Please add some JD.json files (e.g., 'Senior_Software_Engineer_JD.json').")
@@ -50,38 +51,47 @@ def apply_for_roles_page():
             st.rerun()
         return
 
-    st.subheader("Available Job Descriptions:")
+    st.subheader("Recommended for You:")
 
     # Load the candidate's own LinkedIn data (which should exist by now)
     user_linkedin_url = current_user_data['linkedin_url']
+
+    # Rank the JDs for this candidate (cached until their profile or the JD catalogue changes)
+    # and only render the visible page, so render time does not grow with the number of JDs
+    with metrics.span("rank_jds"):
+        ranked_filenames, similarities = rank_jds(jds, user_linkedin_url)
+    visible_count = st.session_state.setdefault('jd_visible_count', JD_PAGE_SIZE)
  
     # Display each JD with an expander and an "I'm interested" button
-    for jd in jds:
-        jd_filename = jd['filename']
-        jd_title = jd['data'].get('job_title', 'N/A')
-        jd_company = jd['data'].get('company', 'N/A')
+    for jd_filename in ranked_filenames[:visible_count]:
+        jd_data = jd_catalog.get(jd_filename)
+        if jd_data is None:
+            continue
+        jd_title = jd_data.get('job_title', 'N/A')
+        jd_company = jd_data.get('company', 'N/A')
+        match = f" ({similarities[jd_filename]:.0%} match)" if jd_filename in similarities else ""
         
         # Use st.expander for a collapsible view of the JD details
-        with st.expander(f"**{jd_title}** at **{jd_company}**"):
-            st.json(jd['data']) # Display full JD JSON content
+        with st.expander(f"**{jd_title}** at **{jd_company}**{match}"):
+            st.json(jd_data) # Display full JD JSON content
 
 
-            if st.button(f"I'm interested in {jd_title}", key=f"interest_button_{jd['filename']}"):                
-                global user_inputs
-                user_inputs.loc[-1] = [user_linkedin_url, jd_title, jd_filename, None]
-                user_inputs.index = user_inputs.index + 1
-                user_inputs = user_inputs.sort_index()
-                
-                print(user_inputs.head())
-                
-                user_inputs.to_csv("./user_inputs.csv", index=False)
-                
+            if st.button(f"I'm interested in {jd_title}", key=f"interest_button_{jd_filename}"):                
+                # Single-row append to the application store; the scorer picks it up from there
+                get_application_store().add_application(user_linkedin_url, jd_title, jd_filename)
+
                 st.success(f"## You have successfully applied for {jd_title}.")
-                
+
+    if visible_count < len(ranked_filenames):
+        st.caption(f"Showing {visible_count} of {len(ranked_filenames)} roles")
+        if st.button("Show more roles"):
+            st.session_state['jd_visible_count'] = visible_count + JD_PAGE_SIZE
+            st.rerun()
                 
     # Logout button at the bottom of the page
     if st.button("Logout"):
         st.session_state['logged_in'] = False
         st.session_state['current_user'] = None
         st.session_state['page'] = 'login'
+        st.session_state.pop('jd_visible_count', None)
         st.rerun() # Rerun to go back to login page
\ No newline at end of file
@@ -1,9 +1,7 @@
 import streamlit as st
-import os
-import json
 
-from helper import load_users, save_users, sanitize_filename
-from constants import USERS_FILE, SCRAPED_DATA_DIR
+from user_store import get_user_store, is_recruiter
+from profile_store import get_profile_store
 
 def login_page():
     """Renders the login page for existing users."""
@@ -21,13 +19,15 @@ def login_page():
             signup_button = st.form_submit_button("Sign Up (New User)")
 
         if login_button:
-            users = load_users()
-            if username in users and users[username]['password'] == password:
+            user_data = get_user_store().get_user(username)
+            if user_data and user_data['password'] == password:
                 st.session_state['logged_in'] = True
                 st.session_state['current_user'] = username
-                # Check if user has linkedin_url and if the scraped data file exists
-                user_data = users[username]
-                if user_data.get('linkedin_url') and os.path.exists(os.path.join(SCRAPED_DATA_DIR, sanitize_filename(user_data['linkedin_url']))):
+                # Recruiters go to the applicant leaderboards
+                if is_recruiter(username):
+                    st.session_state['page'] = 'recruiter'
+                # Check if user has linkedin_url and if their profile has been scraped
+                elif user_data.get('linkedin_url') and get_profile_store().exists(user_data['linkedin_url']):
                     st.session_state['page'] = 'apply_for_roles'
                 else:
                     st.session_state['page'] = 'setup_profile'
@@ -52,17 +52,14 @@ def signup_page():
         signup_submit_button = st.form_submit_button("Create Account")
 
         if signup_submit_button:
-            users = load_users()
             if not new_username or not new_password or not confirm_password:
                 st.error("All fields are required.")
             elif new_password != confirm_password:
                 st.error("Passwords do not match.")
-            elif new_username in users:
+            # Store new user with password and without LinkedIn URL initially; fails if the name is taken
+            elif not get_user_store().create_user(new_username, new_password):
                 st.error("Username or email already exists. Please choose another or log in.")
             else:
-                # Store new user with password and without LinkedIn URL initially
-                users[new_username] = {'password': new_password, 'linkedin_url': None, 'name': None}
-                save_users(users)
                 st.success("Account created successfully! Please proceed to set up your profile.")
                 st.session_state['logged_in'] = True
                 st.session_state['current_user'] = new_username
@@ -0,0 +1,76 @@
+import streamlit as st
+from datetime import datetime
+
+from constants import JDS_DIR, LEADERBOARD_PAGE_SIZES
+from jd_catalog import get_jd_catalog
+from application_store import get_application_store
+import metrics
+
+
+def recruiter_page():
+    """Renders the recruiter view: the ranked, scored applicants for one JD at a time."""
+    st.title("Applicant Leaderboards")
+
+    jds = get_jd_catalog().list_jds()
+    if not jds:
+        st.info(f"No Job Descriptions found in the '{JDS_DIR}' folder.")
+    else:
+        labels = {
+            f"{jd['data'].get('job_title', 'N/A')} at {jd['data'].get('company', 'N/A')} ({jd['filename']})": jd['filename']
+            for jd in jds
+        }
+        jd_filename = labels[st.selectbox("Job Description", list(labels))]
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            min_score, max_score = st.slider("Score range", 0, 100, (0, 100))
+        with col2:
+            page_size = st.selectbox("Applicants per page", LEADERBOARD_PAGE_SIZES)
+
+        # Keyset pagination: the (score, id) of the last row of every page shown so far.
+        # Changing the JD or any filter starts again from the first page.
+        query = (jd_filename, min_score, max_score, page_size)
+        if st.session_state.get('leaderboard_query') != query:
+            st.session_state['leaderboard_query'] = query
+            st.session_state['leaderboard_cursors'] = []
+        cursors = st.session_state['leaderboard_cursors']
+
+        store = get_application_store()
+        with metrics.span("leaderboard_query"):
+            total = store.count_scored(jd_filename, min_score, max_score)
+            rows = store.leaderboard(jd_filename, page_size, min_score, max_score, after=cursors[-1] if cursors else None)
+
+        first_rank = len(cursors) * page_size + 1
+        st.caption(f"{total} scored applicants in range" + (f", showing #{first_rank}-#{first_rank + len(rows) - 1}" if rows else ""))
+        if rows:
+            st.dataframe(
+                [
+                    {
+                        "Rank": first_rank + i,
+                        "Candidate": row['user_linkedin_url'],
+                        "Score": row['score'],
+                        "Applied": datetime.fromtimestamp(row['created_at']).strftime("%Y-%m-%d %H:%M"),
+                    }
+                    for i, row in enumerate(rows)
+                ],
+                hide_index=True,
+            )
+        else:
+            st.info("No scored applicants in this score range yet.")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if cursors and st.button("Previous page"):
+                cursors.pop()
+                st.rerun()
+        with col2:
+            if len(rows) == page_size and first_rank + len(rows) <= total and st.button("Next page"):
+                cursors.append((rows[-1]['score'], rows[-1]['id']))
+                st.rerun()
+
+    if st.button("Logout"):
+        st.session_state['logged_in'] = False
+        st.session_state['current_user'] = None
+        st.session_state['page'] = 'login'
+        st.session_state.pop('leaderboard_query', None)
+        st.session_state.pop('leaderboard_cursors', None)
+        st.rerun() # Rerun to go back to login page
@@ -1,30 +1,48 @@
 import streamlit as st
-import os
-import json
+import time
 
-from constants import USERS_FILE, SCRAPED_DATA_DIR
-from helper import load_users, save_users, sanitize_filename
+from constants import JOB_STATUS_REFRESH_INTERVAL, JOB_QUEUED_TIMEOUT
+from user_store import get_user_store
+from job_queue import get_job_queue, SCRAPE_PROFILE, QUEUED, DONE, FAILED
+from profile_freshness import is_profile_fresh
 
-from LinkedIn_Scrapper.main import scrape_profile
+def submit_scrape_job(linkedin_url):
+    """Queues a background scrape of the profile (run by job_worker.py) and returns the job id."""
+    return get_job_queue().submit(SCRAPE_PROFILE, {"linkedin_url": linkedin_url})
 
-def scrape_linkedin_profile(linkedin_url, user_name):
-    filename = os.path.join(SCRAPED_DATA_DIR, sanitize_filename(linkedin_url))
-
-    if os.path.exists(filename):
-        st.info(f"LinkedIn data for {user_name} (from {linkedin_url}) already exists.")
-        with open(filename, 'r') as f:
-            return json.load(f)
-
-    # st.warning(f"Simulating LinkedIn data scraping for {linkedin_url}...")
-    scrapping = scrape_profile(linkedin_url)
-    st.warning(f"{scrapping} for {linkedin_url}...")
+def show_scrape_job_status(job_id):
+    """
+    Polls a background scrape job, redirecting to the job applications page once it finishes.
+    Gives up with an error if no worker has started the job within JOB_QUEUED_TIMEOUT seconds.
+    """
+    job = get_job_queue().get(job_id)
+    if job is None or job['status'] == FAILED:
+        error = job['error'] if job else "job not found"
+        st.error(f"Failed to scrape your LinkedIn profile ({error}). Please try again.")
+        del st.session_state['scrape_job_id']
+        if st.button("Back to Profile Setup"):
+            st.rerun()
+    elif job['status'] == DONE:
+        st.success("LinkedIn profile data scraped and saved!")
+        del st.session_state['scrape_job_id']
+        st.session_state['page'] = 'apply_for_roles'
+        st.rerun() # Rerun to switch page
+    elif job['status'] == QUEUED and time.time() - job['created_at'] > JOB_QUEUED_TIMEOUT:
+        st.error("Your profile is still waiting to be scraped. The background worker (`python job_worker.py`) may not be running; please try again later.")
+        del st.session_state['scrape_job_id']
+        if st.button("Back to Profile Setup"):
+            st.rerun()
+    else:
+        with st.spinner(f"Scraping your LinkedIn profile in the background ({job['status']})..."):
+            time.sleep(JOB_STATUS_REFRESH_INTERVAL)
+        st.rerun() # Rerun to poll the job again
     
 def setup_profile_page():
     """Renders the profile setup page for new or incomplete profiles."""
     st.title("Set Up Your Profile")
 
     # Fetch current user data from the loaded users file
-    current_user_data = load_users().get(st.session_state['current_user'])
+    current_user_data = get_user_store().get_user(st.session_state['current_user'])
     if not current_user_data:
         st.error("User data not found. Please log in again.")
         st.session_state['logged_in'] = False
@@ -33,6 +51,11 @@ def setup_profile_page():
         st.rerun()
         return
 
+    # A scrape submitted earlier in this session is still being tracked
+    if st.session_state.get('scrape_job_id'):
+        show_scrape_job_status(st.session_state['scrape_job_id'])
+        return
+
     st.markdown("Please provide your name and LinkedIn profile URL to set up your profile.")
 
     with st.form("profile_setup_form"):
@@ -48,23 +71,14 @@ def setup_profile_page():
                 st.error("Please enter a valid LinkedIn URL (e.g., https://www.linkedin.com/in/your-profile).")
             else:
                 # Update user data with name and linkedin_url
-                users = load_users()
-                users[st.session_state['current_user']]['name'] = name
-                users[st.session_state['current_user']]['linkedin_url'] = linkedin_url
-                save_users(users)
+                get_user_store().update_user(st.session_state['current_user'], name=name, linkedin_url=linkedin_url)
 
-                # Check if LinkedIn data for this URL has already been scraped
-                filename = os.path.join(SCRAPED_DATA_DIR, sanitize_filename(linkedin_url))
-                if not os.path.exists(filename):
-                    st.info("LinkedIn profile data not found. Attempting to scrape...")
-                    # Call the placeholder scraper. Replace with your actual API.
-                    scraped_data = scrape_linkedin_profile(linkedin_url, name)
-                    if scraped_data:
-                        st.success("LinkedIn profile data simulated and saved!")
-                        st.session_state['page'] = 'apply_for_roles'
-                        st.rerun() # Rerun to switch page
-                    else:
-                        st.error("Failed to simulate LinkedIn data scraping. Please try again.")
+                # Check if fresh LinkedIn data for this URL has already been scraped
+                if not is_profile_fresh(linkedin_url):
+                    st.info("LinkedIn profile data not found or out of date. Attempting to scrape...")
+                    # Scraping runs in the background job worker; this session only polls its status
+                    st.session_state['scrape_job_id'] = submit_scrape_job(linkedin_url)
+                    st.rerun() # Rerun to start polling
                 else:
                     st.success("Profile saved! LinkedIn data already exists. Redirecting to job applications...")
                     st.session_state['page'] = 'apply_for_roles'
@@ -0,0 +1,189 @@
+import re
+
+import numpy as np
+
+
+# --- Local Pre-Scoring ---
+# A fast, deterministic approximation of the Gemini score computed from the structured JD fields
+# (required_skills, required_experience_years, required_education, keywords) and the scraped
+# profile (experiences, educations, about). It is used to pick the top-K candidates per JD
+# before spending Gemini calls on them.
+
+SKILLS_WEIGHT = 0.5
+EXPERIENCE_WEIGHT = 0.2
+EDUCATION_WEIGHT = 0.15
+KEYWORDS_WEIGHT = 0.15
+
+# A skill counts as present when at least this fraction of its terms appear in the profile
+SKILL_MATCH_THRESHOLD = 0.5
+
+STOPWORDS = {
+    "a", "an", "and", "as", "at", "for", "in", "of", "on", "or", "the", "to", "with",
+    "skills", "skill", "processes", "technologies", "experience", "e", "g",
+}
+
+EDUCATION_LEVELS = [
+    (4, ("phd", "ph.d", "doctor", "doctorate")),
+    (3, ("master", "m.tech", "mtech", "m.sc", "msc", "mba", "m.s", "m.e")),
+    (2, ("bachelor", "b.tech", "btech", "b.e", "b.sc", "bsc", "b.s", "undergraduate")),
+    (1, ("diploma", "associate", "certificate")),
+]
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+_YEARS_RE = re.compile(r"(\d+)\s*yrs?")
+_MONTHS_RE = re.compile(r"(\d+)\s*mos?")
+
+
+def tokenize(text):
+    """Lowercases text and splits it into terms, keeping tokens like 'c++', 'c#' and 'node.js'."""
+    if not text:
+        return []
+    return [token.rstrip(".") for token in _TOKEN_RE.findall(str(text).lower())]
+
+def phrase_terms(phrase):
+    """Returns the significant terms of a skill or keyword phrase."""
+    return [term for term in tokenize(phrase) if term and term not in STOPWORDS]
+
+def education_level(text):
+    """Maps a degree or requirement string to an ordinal level (0 if unknown)."""
+    text = str(text or "").lower()
+    for level, markers in EDUCATION_LEVELS:
+        if any(marker in text for marker in markers):
+            return level
+    return 0
+
+def duration_to_years(duration):
+    """Converts a LinkedIn duration such as '2 yrs 3 mos' into years."""
+    if not duration:
+        return 0.0
+    duration = str(duration).lower()
+    years = sum(int(n) for n in _YEARS_RE.findall(duration))
+    months = sum(int(n) for n in _MONTHS_RE.findall(duration))
+    return years + months / 12.0
+
+def candidate_text(candidate_data):
+    """Concatenates the free-text parts of a scraped profile used for skill and keyword matching."""
+    parts = [candidate_data.get("about") or ""]
+    for experience in candidate_data.get("experiences") or []:
+        parts.extend(str(experience.get(field) or "") for field in ("position_title", "institution_name", "description"))
+    for education in candidate_data.get("educations") or []:
+        parts.extend(str(education.get(field) or "") for field in ("degree", "institution_name", "description"))
+    return " ".join(parts)
+
+def candidate_experience_years(candidate_data):
+    """Total years of professional experience, summed from the experience durations."""
+    return sum(duration_to_years(experience.get("duration")) for experience in candidate_data.get("experiences") or [])
+
+def candidate_education_level(candidate_data):
+    """Highest education level found among the candidate's degrees."""
+    return max((education_level(education.get("degree")) for education in candidate_data.get("educations") or []), default=0)
+
+
+def prescore_matrix(jds, candidates):
+    """
+    Scores every candidate against every JD without any LLM call.
+    jds and candidates are lists of parsed JD / scraped profile dicts.
+    Returns an array of shape (len(candidates), len(jds)) with scores between 0 and 100.
+    """
+    # Phrases (skills and keywords of all JDs) as rows of a phrase-term matrix
+    vocabulary = {}
+    phrase_rows, phrase_cols = [], []
+    phrases = []  # (jd index, kind, weight, mandatory)
+    for jd_idx, jd in enumerate(jds):
+        for skill in jd.get("required_skills") or []:
+            phrases.append((jd_idx, "skill", float(skill.get("weight", 1) or 1), bool(skill.get("mandatory"))))
+            for term in set(phrase_terms(skill.get("skill"))):
+                phrase_rows.append(len(phrases) - 1)
+                phrase_cols.append(vocabulary.setdefault(term, len(vocabulary)))
+        for keyword in jd.get("keywords") or []:
+            phrases.append((jd_idx, "keyword", 1.0, False))
+            for term in set(phrase_terms(keyword)):
+                phrase_rows.append(len(phrases) - 1)
+                phrase_cols.append(vocabulary.setdefault(term, len(vocabulary)))
+
+    phrase_terms_matrix = np.zeros((len(phrases), len(vocabulary)), dtype=np.float32)
+    phrase_terms_matrix[phrase_rows, phrase_cols] = 1.0
+    term_counts = phrase_terms_matrix.sum(axis=1)
+    phrase_terms_matrix /= np.maximum(term_counts, 1.0)[:, None]
+
+    # Candidates as rows of a binary candidate-term matrix over the same vocabulary
+    candidate_terms_matrix = np.zeros((len(candidates), len(vocabulary)), dtype=np.float32)
+    for cand_idx, candidate in enumerate(candidates):
+        cols = {vocabulary[token] for token in tokenize(candidate_text(candidate)) if token in vocabulary}
+        if cols:
+            candidate_terms_matrix[cand_idx, list(cols)] = 1.0
+
+    # Fraction of each phrase's terms found in each candidate, thresholded to present / absent
+    phrase_match = (candidate_terms_matrix @ phrase_terms_matrix.T) >= SKILL_MATCH_THRESHOLD
+    phrase_match &= (term_counts > 0)[None, :]
+    phrase_match = phrase_match.astype(np.float32)
+
+    # Aggregate phrases per JD with weight matrices of shape (n_phrases, n_jds)
+    phrase_jd = np.array([p[0] for p in phrases], dtype=np.int64)
+    weights = np.array([p[2] for p in phrases], dtype=np.float32)
+    is_skill = np.array([p[1] == "skill" for p in phrases], dtype=bool)
+    is_mandatory = np.array([p[3] for p in phrases], dtype=bool)
+
+    def per_jd(mask, values):
+        matrix = np.zeros((len(phrases), len(jds)), dtype=np.float32)
+        matrix[np.nonzero(mask)[0], phrase_jd[mask]] = values[mask]
+        return matrix
+
+    ones = np.ones(len(phrases), dtype=np.float32)
+    skill_weights = per_jd(is_skill, weights)
+    mandatory_weights = per_jd(is_mandatory, ones)
+    keyword_weights = per_jd(~is_skill, ones)
+
+    def ratio(matrix):
+        totals = matrix.sum(axis=0)
+        scores = (phrase_match @ matrix) / np.maximum(totals, 1e-9)
+        # A JD without any such phrase does not penalise candidates
+        return np.where(totals > 0, scores, 1.0)
+
+    skills_score = ratio(skill_weights)
+    mandatory_score = ratio(mandatory_weights)
+    keywords_score = ratio(keyword_weights)
+
+    # Experience and education as per-candidate vectors compared against per-JD requirements
+    years = np.array([candidate_experience_years(c) for c in candidates], dtype=np.float32)
+    required_years = np.array([float(jd.get("required_experience_years") or 0) for jd in jds], dtype=np.float32)
+    experience_score = np.where(
+        required_years[None, :] > 0,
+        np.minimum(years[:, None] / np.maximum(required_years[None, :], 1e-9), 1.0),
+        1.0,
+    )
+
+    levels = np.array([candidate_education_level(c) for c in candidates], dtype=np.float32)
+    required_levels = np.array(
+        [min((education_level(e) for e in jd.get("required_education") or [] if education_level(e)), default=0) for jd in jds],
+        dtype=np.float32,
+    )
+    education_score = np.where(
+        required_levels[None, :] > 0,
+        np.minimum(levels[:, None] / np.maximum(required_levels[None, :], 1e-9), 1.0),
+        1.0,
+    )
+
+    score = (
+        SKILLS_WEIGHT * skills_score
+        + EXPERIENCE_WEIGHT * experience_score
+        + EDUCATION_WEIGHT * education_score
+        + KEYWORDS_WEIGHT * keywords_score
+    )
+    # Missing mandatory skills carry a heavy penalty, mirroring the Gemini prompt
+    score *= 0.5 + 0.5 * mandatory_score
+    return np.round(100.0 * score, 2)
+
+def prescore_candidates(jd, candidates):
+    """Scores a list of candidates against a single JD. Returns a 1-D array of scores."""
+    if not candidates:
+        return np.zeros(0, dtype=np.float32)
+    return prescore_matrix([jd], candidates)[:, 0]
+
+def top_k_indices(scores, k):
+    """Returns the indices of the k highest scores, best first."""
+    scores = np.asarray(scores)
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    top = np.argpartition(-scores, k)[:k]
+    return top[np.argsort(-scores[top], kind="stable")]
@@ -0,0 +1,89 @@
+import argparse
+import time
+
+from constants import PROFILE_TTL_SECONDS
+from LinkedIn_Scrapper.main import profile_content_hash, scrape_profile
+from application_store import get_application_store
+from profile_store import get_profile_store
+import metrics
+
+
+def read_profile(linkedin_url):
+    """Loads a candidate's scraped profile from the profile store, or None if it has not been scraped."""
+    return get_profile_store().get(linkedin_url)
+
+def content_hash(profile_data):
+    """The stored content hash of a profile, computing it for profiles saved without one."""
+    return profile_data.get('content_hash') or profile_content_hash(profile_data)
+
+def is_profile_fresh(linkedin_url, ttl=PROFILE_TTL_SECONDS):
+    """True if the candidate's scraped profile exists and is younger than ttl seconds."""
+    metadata = get_profile_store().get_metadata(linkedin_url)
+    if metadata is None:
+        return False
+    return time.time() - (metadata['scraped_at'] or 0.0) < ttl
+
+def find_stale_profiles(ttl=PROFILE_TTL_SECONDS):
+    """Returns (linkedin_url, content hash) of every scraped profile older than ttl seconds."""
+    stale = []
+    for metadata in get_profile_store().list_metadata(scraped_before=time.time() - ttl):
+        old_hash = metadata['content_hash']
+        if old_hash is None:
+            old_hash = content_hash(read_profile(metadata['linkedin_url']))
+        stale.append((metadata['linkedin_url'], old_hash))
+    return stale
+
+def refresh_profile(linkedin_url, old_hash=None, pool=None):
+    """
+    Re-scrapes one profile. If its content hash changed, the candidate's existing scores are
+    reset so the scorer picks the applications up again. Returns True if the content changed.
+    The old hash is recomputed from the stored profile when there is one, so profiles hashed
+    under older rules (e.g. including contacts) are not reported as changed.
+    """
+    old_profile = read_profile(linkedin_url)
+    if old_profile is not None:
+        old_hash = profile_content_hash(old_profile)
+
+    scrape_profile(linkedin_url, pool=pool)
+    new_profile = read_profile(linkedin_url)
+    if new_profile is None:
+        print(f"Re-scraping {linkedin_url} did not produce a profile.")
+        return False
+
+    if content_hash(new_profile) == old_hash:
+        print(f"{linkedin_url} is unchanged; keeping existing scores.")
+        return False
+
+    reset = get_application_store().reset_scores(linkedin_url)
+    print(f"{linkedin_url} changed; {reset} applications queued for re-scoring.")
+    return True
+
+def refresh_stale_profiles(ttl=PROFILE_TTL_SECONDS, limit=None):
+    """Re-scrapes profiles older than ttl seconds. Returns (refreshed, changed) counts."""
+    stale = find_stale_profiles(ttl)[:limit]
+    print(f"{len(stale)} profiles are older than {ttl / 86400:.1f} days")
+    changed = 0
+    for linkedin_url, old_hash in stale:
+        try:
+            changed += refresh_profile(linkedin_url, old_hash=old_hash)
+        except Exception as e:
+            print(f"Failed to refresh {linkedin_url}: {e}")
+    return len(stale), changed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-scrape stale LinkedIn profiles and re-score the ones that changed.")
+    parser.add_argument("--ttl-days", type=float, default=PROFILE_TTL_SECONDS / 86400, help="Re-scrape profiles older than this many days.")
+    parser.add_argument("--limit", type=int, default=None, help="Maximum number of profiles to refresh in this run.")
+    parser.add_argument("--dry-run", action="store_true", help="Only list the stale profiles.")
+    metrics.add_arguments(parser)
+    args = parser.parse_args()
+    metrics.configure_from_args(args)
+
+    ttl = args.ttl_days * 86400
+    if args.dry_run:
+        for linkedin_url, _ in find_stale_profiles(ttl):
+            print(linkedin_url)
+    else:
+        refreshed, changed = refresh_stale_profiles(ttl, limit=args.limit)
+        print(f"Refreshed {refreshed} profiles, {changed} changed")
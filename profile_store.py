@@ -0,0 +1,213 @@
+import argparse
+import json
+import os
+import sqlite3
+import threading
+
+import msgpack
+
+from constants import PROFILES_DB_FILE, SCRAPED_DATA_DIR
+from helper import sanitize_filename
+
+
+# Keys per SELECT ... IN (...) query, well under SQLite's bound-parameter limit
+READ_BATCH_SIZE = 500
+
+# Bookkeeping fields stored with every scraped profile; they are not part of the profile content
+PROFILE_METADATA_FIELDS = ("scraped_at", "content_hash")
+
+
+def strip_profile_metadata(profile_data):
+    """Returns the profile without its bookkeeping fields (scrape time, content hash)."""
+    return {key: value for key, value in profile_data.items() if key not in PROFILE_METADATA_FIELDS}
+
+
+def pack_profile(profile_data):
+    """Encodes a profile dict as msgpack."""
+    return msgpack.packb(profile_data, use_bin_type=True)
+
+def unpack_profile(blob):
+    """Decodes a msgpack-encoded profile."""
+    return msgpack.unpackb(blob, raw=False)
+
+
+class ProfileStore:
+    """
+    Consolidated store of scraped LinkedIn profiles backed by SQLite.
+    Each profile is one msgpack-encoded row indexed by its sanitize_filename key, replacing the
+    per-profile JSON files in scraped_data/. Scrape time and content hash are kept in their own
+    columns so freshness checks never decode a profile, and bulk readers fetch many profiles per query.
+    """
+
+    def __init__(self, path=PROFILES_DB_FILE, legacy_dir=SCRAPED_DATA_DIR):
+        self.path = path
+        self._local = threading.local()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS profiles ("
+                " key TEXT PRIMARY KEY,"
+                " linkedin_url TEXT NOT NULL,"
+                " scraped_at REAL,"
+                " content_hash TEXT,"
+                " data BLOB NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS profiles_scraped_at ON profiles (scraped_at)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        if legacy_dir:
+            self.import_json_dir(legacy_dir)
+
+    def _connect(self):
+        """Returns this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def put(self, profile_data):
+        """Saves a scraped profile (which must have a 'linkedin_url'), replacing any previous version."""
+        linkedin_url = profile_data['linkedin_url']
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO profiles (key, linkedin_url, scraped_at, content_hash, data) VALUES (?, ?, ?, ?, ?)",
+                (
+                    sanitize_filename(linkedin_url), linkedin_url, profile_data.get('scraped_at'),
+                    profile_data.get('content_hash'), pack_profile(profile_data),
+                ),
+            )
+
+    def get(self, linkedin_url):
+        """Returns the candidate's scraped profile, or None if it has not been scraped."""
+        row = self._connect().execute(
+            "SELECT data FROM profiles WHERE key = ?", (sanitize_filename(linkedin_url),)
+        ).fetchone()
+        return unpack_profile(row["data"]) if row is not None else None
+
+    def get_many(self, linkedin_urls):
+        """
+        Batched read for bulk scoring. Returns a dict mapping each URL to its scraped profile
+        (None for profiles that have not been scraped).
+        """
+        keys = {linkedin_url: sanitize_filename(linkedin_url) for linkedin_url in linkedin_urls}
+        unique_keys = list(dict.fromkeys(keys.values()))
+        profiles = {}
+        conn = self._connect()
+        for start in range(0, len(unique_keys), READ_BATCH_SIZE):
+            batch = unique_keys[start:start + READ_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            for row in conn.execute(f"SELECT key, data FROM profiles WHERE key IN ({placeholders})", batch):
+                profiles[row["key"]] = unpack_profile(row["data"])
+        return {linkedin_url: profiles.get(key) for linkedin_url, key in keys.items()}
+
+    def exists(self, linkedin_url):
+        """True if the candidate's profile has been scraped."""
+        return self._connect().execute(
+            "SELECT 1 FROM profiles WHERE key = ?", (sanitize_filename(linkedin_url),)
+        ).fetchone() is not None
+
+    def get_metadata(self, linkedin_url):
+        """Returns the profile's {'linkedin_url', 'scraped_at', 'content_hash'} without decoding it, or None."""
+        row = self._connect().execute(
+            "SELECT linkedin_url, scraped_at, content_hash FROM profiles WHERE key = ?", (sanitize_filename(linkedin_url),)
+        ).fetchone()
+        return dict(row) if row is not None else None
+
+    def list_metadata(self, scraped_before=None):
+        """
+        Returns {'linkedin_url', 'scraped_at', 'content_hash'} of every profile, oldest first,
+        optionally only those scraped before the given timestamp.
+        """
+        query = "SELECT linkedin_url, scraped_at, content_hash FROM profiles"
+        params = ()
+        if scraped_before is not None:
+            query += " WHERE scraped_at IS NULL OR scraped_at < ?"
+            params = (scraped_before,)
+        rows = self._connect().execute(query + " ORDER BY scraped_at, key", params).fetchall()
+        return [dict(row) for row in rows]
+
+    def list_scraped_since(self, since=None):
+        """
+        Returns every profile scraped at or after the given timestamp (all profiles if None),
+        oldest first. Lets in-memory indexes pick up profiles written by other processes.
+        """
+        query = "SELECT data FROM profiles"
+        params = ()
+        if since is not None:
+            query += " WHERE scraped_at >= ?"
+            params = (since,)
+        rows = self._connect().execute(query + " ORDER BY scraped_at, key", params).fetchall()
+        return [unpack_profile(row["data"]) for row in rows]
+
+    def count(self):
+        """Returns the number of stored profiles."""
+        return self._connect().execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def import_json_dir(self, directory, force=False):
+        """
+        One-off migration of a legacy scraped_data/ directory of JSON profiles into the store.
+        Profiles already in the store are left untouched, and corrupted files are skipped.
+        Profiles saved without a scrape time get the file's mtime. Does nothing if this directory
+        has already been imported, unless force is set.
+        """
+        if not os.path.isdir(directory):
+            return 0
+        conn = self._connect()
+        key = f"imported:{os.path.abspath(directory)}"
+        if not force and conn.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+            return 0
+
+        rows = []
+        for filename in sorted(os.listdir(directory)):
+            if not filename.endswith(".json"):
+                continue
+            path = os.path.join(directory, filename)
+            try:
+                with open(path, 'r') as f:
+                    profile_data = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                print(f"Skipping corrupted profile file: {path}")
+                continue
+            if not isinstance(profile_data, dict) or not profile_data.get('linkedin_url'):
+                continue
+            profile_data.setdefault('scraped_at', os.path.getmtime(path))
+            rows.append((
+                sanitize_filename(profile_data['linkedin_url']), profile_data['linkedin_url'],
+                profile_data['scraped_at'], profile_data.get('content_hash'), pack_profile(profile_data),
+            ))
+
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO profiles (key, linkedin_url, scraped_at, content_hash, data) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(len(rows))))
+        print(f"Imported {len(rows)} profiles from {directory}")
+        return len(rows)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_profile_store():
+    """Returns the process-wide profile store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ProfileStore()
+    return _store
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect the profile store or import legacy JSON profiles into it.")
+    parser.add_argument("--import-dir", metavar="DIR", help="Import every JSON profile in DIR (even if it was imported before).")
+    args = parser.parse_args()
+
+    store = get_profile_store()
+    if args.import_dir:
+        store.import_json_dir(args.import_dir, force=True)
+    print(f"{store.count()} profiles in {store.path}")
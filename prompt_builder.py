@@ -0,0 +1,121 @@
+import json
+import re
+
+from constants import PROMPT_CANDIDATE_TOKEN_BUDGET, PROMPT_JD_TOKEN_BUDGET
+
+
+# --- Prompt Compaction ---
+# Scraped profiles carry nulls, empty lists, repeated whitespace and occasionally very long
+# descriptions, so prompt size (and with it latency and cost) used to vary wildly between
+# candidates. Everything embedded in a scoring prompt goes through compact_for_prompt first:
+# empty fields are dropped, text is normalised, and the longest strings are truncated until the
+# serialised data fits its token budget.
+
+# Rough characters-per-token ratio of the Gemini tokenizer on English / JSON text
+CHARS_PER_TOKEN = 4
+# Strings are never truncated below this many characters while fitting a budget
+MIN_FIELD_CHARS = 80
+TRUNCATION_MARKER = "…"
+# Lists dropped item by item (from the end) if truncating text alone does not fit the budget,
+# least useful for scoring first
+LOW_PRIORITY_LISTS = ("interests", "accomplishments", "educations", "experiences")
+
+# repr() of a Selenium WebElement that ended up in a text field instead of its .text
+_WEB_ELEMENT_RE = re.compile(r"^<selenium\.webdriver\.[\w.]+WebElement \(session=")
+_SPACES_RE = re.compile(r"[ \t\r\f\v]+")
+
+
+def estimate_tokens(text):
+    """Approximate token count of a piece of text."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+def to_prompt_json(data):
+    """Serialises data for a prompt without indentation, which is pure token overhead."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+
+def normalize_text(text):
+    """Collapses runs of whitespace and drops blank and consecutive duplicate lines."""
+    lines = []
+    for line in text.splitlines():
+        line = _SPACES_RE.sub(" ", line).strip()
+        if line and (not lines or lines[-1] != line):
+            lines.append(line)
+    return "\n".join(lines)
+
+def normalize(data):
+    """
+    Returns a copy of data with None, empty strings, empty lists / dicts and WebElement reprs
+    removed and all text normalised.
+    """
+    if isinstance(data, dict):
+        items = ((key, normalize(value)) for key, value in data.items())
+        return {key: value for key, value in items if value not in (None, "", [], {})}
+    if isinstance(data, list):
+        items = (normalize(value) for value in data)
+        return [value for value in items if value not in (None, "", [], {})]
+    if isinstance(data, str):
+        if _WEB_ELEMENT_RE.match(data):
+            return None
+        return normalize_text(data)
+    return data
+
+def _truncate_strings(data, max_chars):
+    """Returns a copy of data with every string longer than max_chars cut to max_chars."""
+    if isinstance(data, dict):
+        return {key: _truncate_strings(value, max_chars) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_truncate_strings(value, max_chars) for value in data]
+    if isinstance(data, str) and len(data) > max_chars:
+        return data[:max_chars - len(TRUNCATION_MARKER)].rstrip() + TRUNCATION_MARKER
+    return data
+
+def _longest_string(data):
+    if isinstance(data, dict):
+        return max((_longest_string(value) for value in data.values()), default=0)
+    if isinstance(data, list):
+        return max((_longest_string(value) for value in data), default=0)
+    if isinstance(data, str):
+        return len(data)
+    return 0
+
+def fit_to_budget(data, max_tokens):
+    """
+    Shrinks normalised data until its prompt JSON fits max_tokens. Long strings are truncated first,
+    with the largest per-field cap that fits, so short fields are never touched. If that is not
+    enough, trailing items of the LOW_PRIORITY_LISTS are dropped.
+    """
+    if estimate_tokens(to_prompt_json(data)) <= max_tokens:
+        return data
+
+    # Binary search for the largest per-string cap that fits the budget
+    low, high = MIN_FIELD_CHARS, _longest_string(data)
+    best = _truncate_strings(data, MIN_FIELD_CHARS)
+    while low <= high:
+        cap = (low + high) // 2
+        candidate = _truncate_strings(data, cap)
+        if estimate_tokens(to_prompt_json(candidate)) <= max_tokens:
+            best, low = candidate, cap + 1
+        else:
+            high = cap - 1
+    data = best
+
+    if isinstance(data, dict):
+        for key in LOW_PRIORITY_LISTS:
+            while isinstance(data.get(key), list) and data[key] and estimate_tokens(to_prompt_json(data)) > max_tokens:
+                data[key] = data[key][:-1]
+            if data.get(key) == []:
+                del data[key]
+    return data
+
+def compact_for_prompt(data, max_tokens):
+    """Normalises data and fits it to max_tokens. Returns the compacted copy."""
+    return fit_to_budget(normalize(data), max_tokens)
+
+def compact_candidate(candidate_data_json, max_tokens=PROMPT_CANDIDATE_TOKEN_BUDGET):
+    """Compacts a candidate profile for a scoring prompt. The scraping account's contacts are left out."""
+    candidate_data_json = {key: value for key, value in candidate_data_json.items() if key != "contacts"}
+    return compact_for_prompt(candidate_data_json, max_tokens)
+
+def compact_jd(job_description_json, max_tokens=PROMPT_JD_TOKEN_BUDGET):
+    """Compacts a Job Description for a scoring prompt."""
+    return compact_for_prompt(job_description_json, max_tokens)
@@ -0,0 +1,249 @@
+import argparse
+import threading
+from collections import OrderedDict
+import time
+import zlib
+
+import numpy as np
+
+from constants import RETRIEVAL_HASH_DIM, RETRIEVAL_SYNC_INTERVAL, RETRIEVAL_RANKING_CACHE_SIZE
+from jd_catalog import get_jd_catalog
+from prescore import tokenize, candidate_text, top_k_indices, STOPWORDS
+from profile_store import get_profile_store
+
+
+# --- Local Retrieval Index ---
+# Candidates and JDs are embedded as hashed TF-IDF vectors (unigrams and bigrams hashed into
+# RETRIEVAL_HASH_DIM buckets, sublinear term frequency, smoothed IDF over the indexed corpus) and
+# compared by cosine similarity with a single matrix-vector product, so "best candidates for this JD"
+# over thousands of profiles, or "best JDs for this candidate", needs no LLM call.
+
+
+def text_terms(text):
+    """Significant unigrams and adjacent-word bigrams of a text."""
+    tokens = [token for token in tokenize(text) if len(token) > 1 and token not in STOPWORDS]
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+def hash_term_frequencies(text, dim=RETRIEVAL_HASH_DIM):
+    """Returns the sublinear (1 + log) term-frequency vector of a text in the hashed feature space."""
+    buckets = [zlib.crc32(term.encode("utf-8")) % dim for term in text_terms(text)]
+    counts = np.bincount(np.asarray(buckets, dtype=np.int64), minlength=dim).astype(np.float32)
+    nonzero = counts > 0
+    counts[nonzero] = 1.0 + np.log(counts[nonzero])
+    return counts
+
+def jd_text(jd):
+    """Concatenates the searchable parts of a JD. Skills are repeated by weight so heavier skills count more."""
+    parts = [jd.get("job_title") or ""]
+    for skill in jd.get("required_skills") or []:
+        weight = max(1, int(skill.get("weight", 1) or 1))
+        parts.extend([str(skill.get("skill") or "")] * weight)
+    for field in ("keywords", "required_education", "preferred_certifications"):
+        parts.extend(str(value) for value in jd.get(field) or [])
+    return " ".join(parts)
+
+
+class HashingTfidfIndex:
+    """
+    Incrementally growable TF-IDF index of documents in a hashed feature space.
+    Adding a document appends (or replaces) one row of term frequencies and updates the document
+    frequencies; the IDF-weighted, L2-normalised matrix is rebuilt lazily on the next query.
+    """
+
+    def __init__(self, dim=RETRIEVAL_HASH_DIM):
+        self.dim = dim
+        self._lock = threading.Lock()
+        self._tf = np.zeros((0, dim), dtype=np.float32)
+        self._keys = []
+        self._rows = {}  # key -> row in _tf
+        self._df = np.zeros(dim, dtype=np.float64)
+        self._weighted = None
+        self._idf = None
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._rows
+
+    def add(self, key, text):
+        """Indexes a document, replacing any previous version stored under the same key."""
+        tf = hash_term_frequencies(text, self.dim)
+        with self._lock:
+            row = self._rows.get(key)
+            if row is None:
+                row = len(self._keys)
+                if row == self._tf.shape[0]:
+                    # Grow geometrically so a stream of adds costs amortised O(1) copies
+                    grown = np.zeros((max(16, 2 * row), self.dim), dtype=np.float32)
+                    grown[:row] = self._tf
+                    self._tf = grown
+                self._keys.append(key)
+                self._rows[key] = row
+            else:
+                self._df -= self._tf[row] > 0
+            self._tf[row] = tf
+            self._df += tf > 0
+            self._weighted = None
+
+    def _weighted_matrix(self):
+        """Returns (IDF-weighted, L2-normalised document matrix, idf vector), rebuilding them if stale."""
+        with self._lock:
+            if self._weighted is None:
+                n = len(self._keys)
+                self._idf = (np.log((1.0 + n) / (1.0 + self._df)) + 1.0).astype(np.float32)
+                weighted = self._tf[:n] * self._idf
+                norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+                self._weighted = weighted / np.maximum(norms, 1e-12)
+            return self._weighted, self._idf
+
+    def search(self, text, k=10):
+        """Returns the k documents most similar to text as a list of (key, cosine similarity), best first."""
+        if not self._keys:
+            return []
+        weighted, idf = self._weighted_matrix()
+        query = hash_term_frequencies(text, self.dim) * idf
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+        similarities = weighted @ (query / norm)
+        return [(self._keys[i], float(similarities[i])) for i in top_k_indices(similarities, k)]
+
+
+class RetrievalIndex:
+    """
+    Two-way candidate <-> JD retrieval over the profile store and the JD catalogue.
+    New or re-scraped profiles (including ones written by other processes, e.g. the scrape job
+    worker) and JD changes are picked up incrementally, at most once every sync_interval seconds.
+    """
+
+    def __init__(self, dim=RETRIEVAL_HASH_DIM, sync_interval=RETRIEVAL_SYNC_INTERVAL, ranking_cache_size=RETRIEVAL_RANKING_CACHE_SIZE):
+        self.sync_interval = sync_interval
+        self.ranking_cache_size = ranking_cache_size
+        self.candidates = HashingTfidfIndex(dim)
+        self.jds = HashingTfidfIndex(dim)
+        self._lock = threading.Lock()
+        self._candidate_hashes = {}  # linkedin_url -> content hash of the indexed version
+        self._candidate_texts = {}
+        self._candidate_revisions = {}  # linkedin_url -> number of times the candidate was (re-)indexed
+        self._rankings = OrderedDict()  # linkedin_url -> ((candidate revision, JD catalogue version), ranked JDs), LRU order
+        self._rankings_lock = threading.Lock()
+        self._profiles_synced_at = None  # latest scraped_at seen in the profile store
+        self._jd_texts = {}
+        self._jd_catalog_version = None
+        self._last_sync = None
+
+    def add_candidate(self, profile_data):
+        """Indexes (or re-indexes) one scraped profile."""
+        linkedin_url = profile_data.get('linkedin_url')
+        if not linkedin_url:
+            return
+        content_hash = profile_data.get('content_hash')
+        if content_hash is not None and self._candidate_hashes.get(linkedin_url) == content_hash:
+            return
+        text = candidate_text(profile_data)
+        self.candidates.add(linkedin_url, text)
+        self._candidate_hashes[linkedin_url] = content_hash
+        self._candidate_texts[linkedin_url] = text
+        self._candidate_revisions[linkedin_url] = self._candidate_revisions.get(linkedin_url, 0) + 1
+
+    def sync(self, force=False):
+        """Indexes profiles scraped since the last sync and re-indexes the JDs if the catalogue changed."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._last_sync is not None and now - self._last_sync < self.sync_interval:
+                return
+            self._last_sync = now
+
+            for profile_data in get_profile_store().list_scraped_since(self._profiles_synced_at):
+                self.add_candidate(profile_data)
+                scraped_at = profile_data.get('scraped_at')
+                if scraped_at is not None and (self._profiles_synced_at is None or scraped_at > self._profiles_synced_at):
+                    self._profiles_synced_at = scraped_at
+
+            catalog = get_jd_catalog()
+            jds = catalog.list_jds()
+            if catalog.version != self._jd_catalog_version:
+                texts = {jd["filename"]: jd_text(jd["data"]) for jd in jds}
+                if set(self._jd_texts) - set(texts):
+                    # A JD was removed: rebuild, as the index only supports adds
+                    self.jds = HashingTfidfIndex(self.jds.dim)
+                    self._jd_texts = {}
+                for filename, text in texts.items():
+                    if self._jd_texts.get(filename) != text:
+                        self.jds.add(filename, text)
+                self._jd_texts = texts
+                self._jd_catalog_version = catalog.version
+
+    def best_candidates_for_jd(self, jd_filename, k=10):
+        """Returns the k indexed candidates closest to a JD as (linkedin_url, similarity) pairs."""
+        self.sync()
+        text = self._jd_texts.get(jd_filename)
+        return self.candidates.search(text, k) if text else []
+
+    def best_jds_for_candidate(self, linkedin_url, k=10):
+        """Returns the k JDs closest to a candidate as (jd_filename, similarity) pairs."""
+        self.sync()
+        text = self._candidate_texts.get(linkedin_url)
+        return self.jds.search(text, k) if text else []
+
+    def ranked_jds_for_candidate(self, linkedin_url):
+        """
+        Returns every JD ranked for a candidate as (jd_filename, similarity) pairs, best first.
+        The ranking is computed once per candidate and reused until their profile or the JD
+        catalogue changes, so page reruns only pay for a dict lookup. Only the rankings of the
+        ranking_cache_size most recently seen candidates are kept.
+        """
+        self.sync()
+        version = (self._candidate_revisions.get(linkedin_url), self._jd_catalog_version)
+        with self._rankings_lock:
+            cached = self._rankings.get(linkedin_url)
+            if cached is not None and cached[0] == version:
+                self._rankings.move_to_end(linkedin_url)
+                return cached[1]
+        text = self._candidate_texts.get(linkedin_url)
+        ranking = self.jds.search(text, len(self.jds)) if text else []
+        with self._rankings_lock:
+            # Replaces any ranking of an older revision of this candidate
+            self._rankings[linkedin_url] = (version, ranking)
+            self._rankings.move_to_end(linkedin_url)
+            while len(self._rankings) > self.ranking_cache_size:
+                self._rankings.popitem(last=False)
+        return ranking
+
+
+_index = None
+_index_lock = threading.Lock()
+
+def get_retrieval_index():
+    """Returns the process-wide retrieval index, building it from the profile store on first use."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = RetrievalIndex()
+    return _index
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query the local candidate <-> JD retrieval index.")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--jd", metavar="FILENAME", help="List the best candidates for this JD file.")
+    group.add_argument("--candidate", metavar="LINKEDIN_URL", help="List the best JDs for this candidate.")
+    parser.add_argument("-k", type=int, default=10, help="Number of results.")
+    args = parser.parse_args()
+
+    index = get_retrieval_index()
+    start = time.perf_counter()
+    index.sync(force=True)
+    print(f"Indexed {len(index.candidates)} candidates and {len(index.jds)} JDs in {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    if args.jd:
+        results = index.best_candidates_for_jd(args.jd, args.k)
+    else:
+        results = index.best_jds_for_candidate(args.candidate, args.k)
+    elapsed = time.perf_counter() - start
+    for key, similarity in results:
+        print(f"{similarity:6.3f}  {key}")
+    print(f"Query took {elapsed * 1000:.2f} ms")
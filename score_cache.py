@@ -0,0 +1,81 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from constants import SCORE_CACHE_FILE, SCORE_CACHE_MAX_ENTRIES
+
+
+_lock = threading.Lock()
+
+
+def canonical_json(data):
+    """Serialises data so that logically identical JSON always produces the same string."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+def make_cache_key(job_description_json, candidate_data_json, prompt_template, model_name):
+    """
+    Builds the content-addressed cache key for one scoring request.
+    Any change to the JD, the candidate profile, the prompt template or the model gives a new key.
+    """
+    digest = hashlib.sha256()
+    for part in (
+        canonical_json(job_description_json),
+        canonical_json(candidate_data_json),
+        prompt_template,
+        model_name,
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ScoreCache:
+    """
+    Persistent score cache backed by SQLite.
+    Holds at most max_entries scores and evicts the least recently used ones beyond that.
+    """
+
+    def __init__(self, path=SCORE_CACHE_FILE, max_entries=SCORE_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS scores ("
+                " key TEXT PRIMARY KEY,"
+                " score INTEGER NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS scores_last_used ON scores (last_used)")
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key):
+        """Returns the cached score for key, or None on a miss."""
+        with _lock, self._connect() as conn:
+            row = conn.execute("SELECT score FROM scores WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE scores SET last_used = ? WHERE key = ?", (time.time(), key))
+            return row[0]
+
+    def set(self, key, score):
+        """Stores a score and evicts the least recently used entries if the cache is over its bound."""
+        with _lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO scores (key, score, last_used) VALUES (?, ?, ?)",
+                (key, score, time.time()),
+            )
+            count = conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+            if count > self.max_entries:
+                conn.execute(
+                    "DELETE FROM scores WHERE key IN ("
+                    " SELECT key FROM scores ORDER BY last_used ASC LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
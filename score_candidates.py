@@ -1,116 +1,466 @@
+import argparse
 import json
-import os
-import pandas as pd
-import numpy as np
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import google.generativeai as genai
-from dotenv import load_dotenv
+from constants import SCORING_CONCURRENCY, SCORING_GROUP_SIZE, SCORING_MAX_ATTEMPTS, SCORING_RETRY_BACKOFF
+from application_store import get_application_store
+from score_cache import ScoreCache, make_cache_key
+from jd_catalog import get_jd_catalog
+from profile_store import get_profile_store, strip_profile_metadata
+from prescore import prescore_candidates, top_k_indices
+from prompt_builder import compact_candidate, compact_jd, estimate_tokens, to_prompt_json
+from llm_backend import get_backend, LLMError, RateLimitError
+import metrics
 
+LLM_REQUESTS = metrics.counter("llm_requests_total", "Scoring model calls, by backend and outcome (ok / error / rate_limited).")
+LLM_REQUEST_SECONDS = metrics.histogram("llm_request_seconds", "Latency of scoring model calls, by backend.")
+LLM_PROMPT_TOKENS = metrics.histogram("llm_prompt_tokens", "Prompt tokens per model call, as reported by the backend.", buckets=metrics.TOKEN_BUCKETS)
+LLM_TOKENS = metrics.counter("llm_tokens_total", "Tokens billed by the model, by backend and kind (prompt / output).")
+SCORING_RESPONSES = metrics.counter("scoring_responses_total", "Parsed scoring replies, by outcome (valid / invalid / missing).")
+SCORING_RESULTS = metrics.counter("scoring_results_total", "Scoring requests after all retries, by outcome (scored / failed).")
+SCORE_CACHE_LOOKUPS = metrics.counter("score_cache_lookups_total", "Score cache lookups, by result (hit / miss).")
 
-from constants import USERS_FILE, SCRAPED_DATA_DIR, JDS_DIR
-from helper import load_users, sanitize_filename
 
-
-# --- Gemini Backend Logic for Scoring ---
-# Configuration and Initialization
-load_dotenv()
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-
-if GEMINI_API_KEY:
-    genai.configure(api_key=GEMINI_API_KEY)
-else:
-    print("Gemini API Key not found. Please set GEMINI_API_KEY in your .env file.")
+# --- LLM Backend Logic for Scoring ---
+# Every model call goes through llm_backend.get_backend(): Gemini by default, or the local mock
+# (LLM_BACKEND=mock) for offline benchmarks and load tests. The backend (and, for Gemini, the
+# SDK) is only set up on the first call, so mock runs never touch Gemini.
     
-def get_gemini_response(prompt_parts):
-    """Sends a prompt to the Gemini API and returns the text response."""
+def get_llm_response(prompt, response_schema=None):
+    """
+    Sends a prompt to the configured LLM backend and returns the text response, or None on error.
+    With response_schema set, the reply is requested in JSON structured-output mode.
+    Reports the prompt size of every call: the local estimate and the count billed by the backend.
+    """
+    backend = get_backend()
+    estimated_tokens = estimate_tokens(prompt)
     try:
-        model = genai.GenerativeModel("gemini-2.5-flash") # Using gemini-pro for text generation
-        response = model.generate_content(prompt_parts)
-        return response.text
-    except Exception as e:
-        print(f"Error communicating with Gemini API: {e}")
+        with metrics.span("llm_request", backend=backend.name), LLM_REQUEST_SECONDS.time(backend=backend.name):
+            response = backend.generate(prompt, response_schema=response_schema)
+    except RateLimitError as e:
+        LLM_REQUESTS.inc(backend=backend.name, status="rate_limited")
+        print(f"Rate limited by {backend.name}: {e}")
+        return None
+    except LLMError as e:
+        LLM_REQUESTS.inc(backend=backend.name, status="error")
+        print(f"Error communicating with {backend.name}: {e}")
         return None
+    if response.prompt_tokens is not None:
+        LLM_PROMPT_TOKENS.observe(response.prompt_tokens, backend=backend.name)
+        LLM_TOKENS.inc(response.prompt_tokens, backend=backend.name, kind="prompt")
+    if response.output_tokens is not None:
+        LLM_TOKENS.inc(response.output_tokens, backend=backend.name, kind="output")
+    print(f"{backend.name} prompt tokens: {response.prompt_tokens if response.prompt_tokens is not None else 'n/a'} (estimated {estimated_tokens})")
+    LLM_REQUESTS.inc(backend=backend.name, status="ok")
+    return response.text
 
-def score_candidate(job_description_json, candidate_data_json):
-    """
-    Scores a candidate based on a job description and their LinkedIn profile data
-    using the Gemini API.
-    """
-    prompt = f"""
+SCORING_CRITERIA = (
+    "mandatory_skills",
+    "weighted_skills",
+    "experience",
+    "education",
+    "keywords",
+    "overall_fit",
+)
+
+SUBSCORES_SCHEMA = {
+    "type": "object",
+    "properties": {criterion: {"type": "integer"} for criterion in SCORING_CRITERIA},
+    "required": list(SCORING_CRITERIA),
+}
+
+# Structured output: Gemini is constrained to reply with JSON matching these schemas
+SCORE_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "score": {"type": "integer"},
+        "subscores": SUBSCORES_SCHEMA,
+    },
+    "required": ["score", "subscores"],
+}
+
+MULTI_SCORE_RESPONSE_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "candidate": {"type": "integer"},
+            "score": {"type": "integer"},
+            "subscores": SUBSCORES_SCHEMA,
+        },
+        "required": ["candidate", "score", "subscores"],
+    },
+}
+
+SCORING_PROMPT_TEMPLATE = """
 You are an AI-powered recruitment assistant. Your task is to score a candidate based on a given job description and their LinkedIn profile data.
 The score should be between 0 and 100, where 100 is a perfect match.
 
-Consider the following aspects for scoring:
-- **Mandatory Skills:** High penalty if not present.
-- **Weighted Skills:** Factor in the 'weight' of each skill from the JD.
-- **Required Experience Years:** Assess the candidate's professional experience against this.
-- **Required Education:** Match the candidate's education level.
-- **Keywords:** Look for these keywords in 'about', 'description' fields within experience and education, and skill sections.
-- **Overall Fit:** Evaluate the 'about' section and overall career trajectory for alignment with the role.
+Consider the following aspects for scoring, and give each of them a subscore between 0 and 100:
+- **mandatory_skills:** High penalty if not present.
+- **weighted_skills:** Factor in the 'weight' of each skill from the JD.
+- **experience:** Assess the candidate's professional experience against the required experience years.
+- **education:** Match the candidate's education level against the required education.
+- **keywords:** Look for these keywords in 'about', 'description' fields within experience and education, and skill sections.
+- **overall_fit:** Evaluate the 'about' section and overall career trajectory for alignment with the role.
 
-Return ONLY the score as an integer (e.g., 85). Do not include any other text or explanation.
+Reply with a JSON object with the overall integer "score" and the integer "subscores" per aspect.
 
 Here is the Job Description:
-{json.dumps(job_description_json, indent=2)}
+{job_description}
 
 Here is the Candidate's LinkedIn Profile Data:
-{json.dumps(candidate_data_json, indent=2)}
-
-score:
+{candidate_data}
 """
-    response_text = get_gemini_response([prompt])
-    if response_text:
-        try:
-            # Attempt to extract the integer score from the response
-            # This handles cases where Gemini might return "score: 85" or similar
-            score = int("".join(filter(str.isdigit, response_text)))
-            return max(0, min(100, score)) # Ensure score is within 0-100 range
-        except ValueError:
-            print(f"Could not parse score from Gemini response: '{response_text}'. Please refine the prompt.")
+
+_score_cache = None
+_score_cache_lock = threading.Lock()
+
+def get_score_cache():
+    """Returns the shared persistent score cache, creating it on first use."""
+    global _score_cache
+    if _score_cache is None:
+        with _score_cache_lock:
+            if _score_cache is None:
+                _score_cache = ScoreCache()
+    return _score_cache
+
+def score_candidate(job_description_json, candidate_data_json, use_cache=True):
+    """
+    Scores a candidate based on a job description and their LinkedIn profile data
+    using the Gemini API.
+    Both are compacted to their token budgets first (see prompt_builder.py).
+    Identical (JD, profile, prompt, model) requests are answered from the score cache.
+    """
+    job_description_json = compact_jd(job_description_json)
+    candidate_data_json = compact_candidate(candidate_data_json)
+    if use_cache:
+        cache_key = make_cache_key(job_description_json, candidate_data_json, SCORING_PROMPT_TEMPLATE, get_backend().model_name)
+        cached_score = get_score_cache().get(cache_key)
+        SCORE_CACHE_LOOKUPS.inc(result="hit" if cached_score is not None else "miss")
+        if cached_score is not None:
+            return cached_score
+
+    with metrics.span("score_candidate"):
+        score = _request_score(job_description_json, candidate_data_json)
+    if use_cache and score is not None:
+        get_score_cache().set(cache_key, score)
+    return score
+
+def _valid_score(value):
+    """True for an integer (or integral float) score in the 0-100 range."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return False
+    # json.loads accepts NaN, Infinity and overflowing literals like 1e400, which int() rejects
+    if not math.isfinite(value):
+        return False
+    return value == int(value) and 0 <= value <= 100
+
+def _parse_score_result(result):
+    """
+    Validates one decoded {"score", "subscores"} object. Returns (score, subscores), or None
+    if the score or any subscore is missing or outside 0-100.
+    """
+    if not isinstance(result, dict) or not _valid_score(result.get("score")):
+        return None
+    subscores = result.get("subscores")
+    if not isinstance(subscores, dict) or not all(_valid_score(subscores.get(criterion)) for criterion in SCORING_CRITERIA):
+        return None
+    return int(result["score"]), {criterion: int(subscores[criterion]) for criterion in SCORING_CRITERIA}
+
+def _decode_json(response_text):
+    """Decodes a JSON reply, tolerating a markdown code fence around it. Returns None if it is not valid JSON."""
+    text = response_text.strip()
+    if text.startswith("```"):
+        text = text.strip("`").strip()
+        if text.startswith("json"):
+            text = text[len("json"):]
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return None
+
+def parse_score_response(response_text):
+    """Parses a structured single-candidate reply into (score, subscores), or None if it is invalid."""
+    return _parse_score_result(_decode_json(response_text))
+
+def parse_multi_score_response(response_text, expected_count):
+    """
+    Parses a structured multi-candidate reply into a list of (score, subscores) in candidate order,
+    or None if it is invalid, a candidate is missing or any entry is invalid.
+    """
+    results = _decode_json(response_text)
+    if not isinstance(results, list) or len(results) != expected_count:
+        return None
+    parsed = [None] * expected_count
+    for result in results:
+        candidate = result.get("candidate") if isinstance(result, dict) else None
+        if isinstance(candidate, bool) or not isinstance(candidate, int) or not 0 <= candidate < expected_count or parsed[candidate] is not None:
             return None
+        parsed[candidate] = _parse_score_result(result)
+        if parsed[candidate] is None:
+            return None
+    return parsed
+
+def request_structured(prompt, response_schema, parse):
+    """
+    Sends a prompt in JSON structured-output mode and parses the reply with parse(response_text).
+    Invalid or missing replies are retried up to SCORING_MAX_ATTEMPTS times in total, with a
+    linear backoff. Returns the parsed result, or None if every attempt failed.
+    """
+    for attempt in range(1, SCORING_MAX_ATTEMPTS + 1):
+        response_text = get_llm_response(prompt, response_schema=response_schema)
+        parsed = parse(response_text) if response_text else None
+        SCORING_RESPONSES.inc(outcome="missing" if not response_text else "valid" if parsed is not None else "invalid")
+        if parsed is not None:
+            SCORING_RESULTS.inc(outcome="scored")
+            return parsed
+        print(f"Invalid scoring response (attempt {attempt}/{SCORING_MAX_ATTEMPTS}): '{response_text}'")
+        if attempt < SCORING_MAX_ATTEMPTS:
+            time.sleep(SCORING_RETRY_BACKOFF * attempt)
+    SCORING_RESULTS.inc(outcome="failed")
     return None
 
+def _request_score(job_description_json, candidate_data_json):
+    """Sends the scoring prompt for already compacted data to Gemini and returns the validated score."""
+    prompt = SCORING_PROMPT_TEMPLATE.format(
+        job_description=to_prompt_json(job_description_json),
+        candidate_data=to_prompt_json(candidate_data_json),
+    )
+    result = request_structured(prompt, SCORE_RESPONSE_SCHEMA, parse_score_response)
+    if result is None:
+        return None
+    score, subscores = result
+    print(f"Scored {candidate_data_json.get('linkedin_url', 'candidate')}: {score} {subscores}")
+    return score
 
-if __name__ == "__main__":
-    user_inputs_df = pd.read_csv("./user_inputs.csv")
-    
-    for idx, user_input in user_inputs_df.iterrows():
-        print(idx)
-        if str(user_input['score']) == "nan":
-            print("scoring for ", user_input['user_linkedin_url'], "and", user_input['JD'])
+MULTI_SCORING_PROMPT_TEMPLATE = """
+You are an AI-powered recruitment assistant. Your task is to score several candidates against the same job description using their LinkedIn profile data.
+Each score should be between 0 and 100, where 100 is a perfect match. Score every candidate independently of the others.
+
+Consider the following aspects for scoring, and give each of them a subscore between 0 and 100:
+- **mandatory_skills:** High penalty if not present.
+- **weighted_skills:** Factor in the 'weight' of each skill from the JD.
+- **experience:** Assess the candidate's professional experience against the required experience years.
+- **education:** Match the candidate's education level against the required education.
+- **keywords:** Look for these keywords in 'about', 'description' fields within experience and education, and skill sections.
+- **overall_fit:** Evaluate the 'about' section and overall career trajectory for alignment with the role.
+
+Reply with a JSON array of {num_candidates} objects, one per candidate, each with the candidate's number as "candidate", the overall integer "score" and the integer "subscores" per aspect.
+
+Here is the Job Description:
+{job_description}
+
+Here are the Candidates' LinkedIn Profile Data:
+{candidates_data}
+"""
+
+def score_candidates_for_jd(job_description_json, candidates_data_json, use_cache=True):
+    """
+    Scores several candidates for the same job description with a single Gemini request,
+    so the JD is only sent once. Returns a list of scores in the order of candidates_data_json.
+    If every attempt returns an invalid reply, each candidate is scored individually.
+    """
+    job_description_json = compact_jd(job_description_json)
+    candidates_data_json = [compact_candidate(candidate_data_json) for candidate_data_json in candidates_data_json]
+    scores = [None] * len(candidates_data_json)
+    cache_keys = [None] * len(candidates_data_json)
+    if use_cache:
+        for i, candidate_data_json in enumerate(candidates_data_json):
+            cache_keys[i] = make_cache_key(job_description_json, candidate_data_json, SCORING_PROMPT_TEMPLATE, get_backend().model_name)
+            scores[i] = get_score_cache().get(cache_keys[i])
+            SCORE_CACHE_LOOKUPS.inc(result="hit" if scores[i] is not None else "miss")
+
+    uncached = [i for i, score in enumerate(scores) if score is None]
+    if len(uncached) == 1:
+        scores[uncached[0]] = score_candidate(job_description_json, candidates_data_json[uncached[0]], use_cache=use_cache)
+        return scores
+    if not uncached:
+        return scores
+
+    candidates_text = "\n\n".join(
+        f"Candidate {n}:\n{to_prompt_json(candidates_data_json[i])}"
+        for n, i in enumerate(uncached)
+    )
+    prompt = MULTI_SCORING_PROMPT_TEMPLATE.format(
+        num_candidates=len(uncached),
+        job_description=to_prompt_json(job_description_json),
+        candidates_data=candidates_text,
+    )
+    with metrics.span("score_candidates_for_jd", candidates=len(uncached)):
+        group_results = request_structured(
+            prompt, MULTI_SCORE_RESPONSE_SCHEMA, lambda response_text: parse_multi_score_response(response_text, len(uncached))
+        )
+
+    if group_results is None:
+        print(f"Could not get {len(uncached)} valid scores in one request. Falling back to per-candidate scoring.")
+        for i in uncached:
+            scores[i] = score_candidate(job_description_json, candidates_data_json[i], use_cache=use_cache)
+        return scores
+
+    for i, (score, _) in zip(uncached, group_results):
+        scores[i] = score
+        if use_cache:
+            get_score_cache().set(cache_keys[i], score)
+    return scores
+
+
+def load_candidate_data(user_linkedin_url):
+    """Loads the scraped LinkedIn data for a candidate, or None if it has not been scraped."""
+    candidate_data = get_profile_store().get(user_linkedin_url)
+    if candidate_data is None:
+        print(f"LinkedIn data for {user_linkedin_url} was not found. Please re-do profile setup to generate it.")
+        return None
+    # Scrape time and content hash are bookkeeping, not part of what gets scored
+    return strip_profile_metadata(candidate_data)
+
+def load_candidates_data(user_linkedin_urls):
+    """Batched load_candidate_data: returns a dict mapping each URL to its scraped data (or None)."""
+    profiles = get_profile_store().get_many(user_linkedin_urls)
+    candidates = {}
+    for user_linkedin_url, candidate_data in profiles.items():
+        if candidate_data is None:
+            print(f"LinkedIn data for {user_linkedin_url} was not found. Please re-do profile setup to generate it.")
+            candidates[user_linkedin_url] = None
         else:
-            print("already scored for ", user_input['user_linkedin_url'], "and", user_input['JD'], "with score", user_input['score'])
-            continue
-            
-            
-        # Load the candidate's own LinkedIn data (which should exist by now)
-        user_linkedin_url = user_input['user_linkedin_url']
-        candidate_filename = os.path.join(SCRAPED_DATA_DIR, sanitize_filename(user_linkedin_url))
-
-        # Double-check if the candidate's scraped data file exists
-        if not os.path.exists(candidate_filename):
-            print(f"Your LinkedIn data ({candidate_filename}) was not found. Please re-do profile setup to generate it.")
-            continue
-
-        # Load the candidate's own LinkedIn data
-        try:
-            with open(candidate_filename, 'r') as f:
-                candidate_data = json.load(f)
-        except json.JSONDecodeError:
-            print(f"Error loading your LinkedIn data from {candidate_filename}. The file might be corrupted. Please re-do profile setup.")
-            continue
-        
-        filename = user_input['jd_filename']
-        jd_filepath = os.path.join(JDS_DIR, filename)
-        try:
-            with open(jd_filepath, 'r') as f:
-                jd_data = json.load(f)
-        except json.JSONDecodeError:
-            print(f"Skipping malformed JD file: {filename}")
-    
-        score = score_candidate(jd_data, candidate_data) # Call the scoring function
-        user_inputs_df.loc[idx, 'score'] = score
-        
+            candidates[user_linkedin_url] = strip_profile_metadata(candidate_data)
+    return candidates
+
+def load_jd_data(jd_filename):
+    """Returns a Job Description from the JD catalogue, or None if it is missing or malformed."""
+    jd_data = get_jd_catalog().get(jd_filename)
+    if jd_data is None:
+        print(f"Skipping malformed JD file: {jd_filename}")
+    return jd_data
+
+def score_application(user_linkedin_url, jd_filename, use_cache=True):
+    """Loads the candidate and JD data for one application and scores it."""
+    candidate_data = load_candidate_data(user_linkedin_url)
+    if candidate_data is None:
+        return None
+
+    jd_data = load_jd_data(jd_filename)
+    if jd_data is None:
+        return None
 
-            
-    user_inputs_df.to_csv("./user_inputs.csv", index=False)
\ No newline at end of file
+    return score_candidate(jd_data, candidate_data, use_cache=use_cache) # Call the scoring function
+
+def score_application_group(jd_filename, applications, use_cache=True):
+    """
+    Scores a group of (application id, LinkedIn URL) applications to the same JD with one prompt.
+    Returns a dict mapping each application id to its score (None if it could not be scored).
+    """
+    results = {application_id: None for application_id, _ in applications}
+    jd_data = load_jd_data(jd_filename)
+    if jd_data is None:
+        return results
+
+    candidates = load_candidates_data([user_linkedin_url for _, user_linkedin_url in applications])
+    loaded = []
+    for application_id, user_linkedin_url in applications:
+        candidate_data = candidates[user_linkedin_url]
+        if candidate_data is not None:
+            loaded.append((application_id, candidate_data))
+    if not loaded:
+        return results
+
+    scores = score_candidates_for_jd(jd_data, [candidate_data for _, candidate_data in loaded], use_cache=use_cache)
+    for (application_id, _), score in zip(loaded, scores):
+        results[application_id] = score
+    return results
+
+def select_top_candidates(jd_filename, applications, top_k):
+    """
+    Ranks (application id, LinkedIn URL) applications to one JD with the local pre-scorer and
+    returns only the top_k of them. The others are left unscored.
+    """
+    if len(applications) <= top_k:
+        return applications
+    jd_data = load_jd_data(jd_filename)
+    if jd_data is None:
+        return applications
+
+    candidates_by_url = load_candidates_data([user_linkedin_url for _, user_linkedin_url in applications])
+    candidates = [candidates_by_url[user_linkedin_url] or {} for _, user_linkedin_url in applications]
+    prescores = prescore_candidates(jd_data, candidates)
+    selected = [applications[i] for i in top_k_indices(prescores, top_k)]
+    print(f"Pre-scoring kept {len(selected)} of {len(applications)} applications for {jd_filename}")
+    return selected
+
+def _timed_score_application_group(jd_filename, applications, use_cache):
+    with metrics.span("score_application_group", jd=jd_filename, applications=len(applications)):
+        return score_application_group(jd_filename, applications, use_cache)
+
+def score_applications(applications, max_workers=SCORING_CONCURRENCY, use_cache=True, group_size=SCORING_GROUP_SIZE, top_k=None, on_score=None):
+    """
+    Scores a list of application dicts (with 'id', 'user_linkedin_url', 'JD' and 'jd_filename'),
+    keeping at most max_workers Gemini requests in flight. on_score(id, score) is called as each
+    score arrives. Returns a dict mapping application id to score for every application attempted.
+    With group_size > 1, up to group_size applications to the same JD share one prompt.
+    With top_k set, only the top_k applications per JD by local pre-score are sent to Gemini.
+    """
+    pending_by_jd = {}
+    for application in applications:
+        print("scoring for ", application['user_linkedin_url'], "and", application['JD'])
+        pending_by_jd.setdefault(application['jd_filename'], []).append((application['id'], application['user_linkedin_url']))
+
+    if top_k is not None:
+        for jd_filename, jd_applications in pending_by_jd.items():
+            pending_by_jd[jd_filename] = select_top_candidates(jd_filename, jd_applications, top_k)
+
+    group_size = max(1, group_size)
+    groups = [
+        (jd_filename, jd_applications[start:start + group_size])
+        for jd_filename, jd_applications in pending_by_jd.items()
+        for start in range(0, len(jd_applications), group_size)
+    ]
+
+    scores = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_timed_score_application_group, jd_filename, jd_applications, use_cache): jd_applications
+            for jd_filename, jd_applications in groups
+        }
+        for future in as_completed(futures):
+            try:
+                results = future.result()
+            except Exception as e:
+                print(f"Scoring failed for applications {[application_id for application_id, _ in futures[future]]}: {e}")
+                results = {application_id: None for application_id, _ in futures[future]}
+            for application_id, score in results.items():
+                scores[application_id] = score
+                if on_score is not None:
+                    on_score(application_id, score)
+
+    return scores
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score pending applications from the application store using Gemini.")
+    parser.add_argument("--concurrency", type=int, default=SCORING_CONCURRENCY, help="Maximum number of Gemini requests in flight.")
+    parser.add_argument("--no-cache", action="store_true", help="Always call Gemini, bypassing the persistent score cache.")
+    parser.add_argument("--group-size", type=int, default=SCORING_GROUP_SIZE, help="Number of applicants to the same JD scored in one prompt.")
+    parser.add_argument("--top-k", type=int, default=None, help="Only send the top K pending applications per JD (by local pre-score) to Gemini.")
+    metrics.add_arguments(parser)
+    args = parser.parse_args()
+    metrics.configure_from_args(args)
+
+    store = get_application_store()
+    # Only unscored applications are claimed; already scored ones are never re-read
+    claimed = store.claim_unscored()
+    print(f"Claimed {len(claimed)} unscored applications")
+    try:
+        score_applications(
+            claimed,
+            max_workers=args.concurrency,
+            use_cache=not args.no_cache,
+            group_size=args.group_size,
+            top_k=args.top_k,
+            on_score=store.set_score,
+        )
+    finally:
+        # Applications left out by --top-k (or interrupted) go back to the pending queue
+        store.release([application['id'] for application in claimed])
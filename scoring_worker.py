@@ -0,0 +1,195 @@
+import argparse
+import json
+import os
+import time
+from collections import deque
+
+from constants import (
+    SCORING_CONCURRENCY, SCORING_GROUP_SIZE, WORKER_POLL_INTERVAL, WORKER_BATCH_SIZE,
+    WORKER_RETRY_INTERVAL, WORKER_CHECKPOINT_FILE, WORKER_STATS_FILE,
+)
+from application_store import get_application_store
+from score_candidates import score_applications
+import metrics
+
+
+# Completions within this many seconds are used to compute the current throughput
+THROUGHPUT_WINDOW = 60.0
+
+
+def _write_json_atomically(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=4)
+    os.replace(tmp_path, path)
+
+
+class ScoringWorker:
+    """
+    Long-running scorer that tails the application store and scores new applications as they arrive.
+    The id of the newest application handled is checkpointed, so after a restart only applications
+    past the checkpoint are polled. Older applications that failed to score are retried every
+    retry_interval seconds. Throughput and queue depth are written to stats_file after every batch.
+    """
+
+    def __init__(
+        self,
+        store=None,
+        max_workers=SCORING_CONCURRENCY,
+        group_size=SCORING_GROUP_SIZE,
+        batch_size=WORKER_BATCH_SIZE,
+        poll_interval=WORKER_POLL_INTERVAL,
+        retry_interval=WORKER_RETRY_INTERVAL,
+        use_cache=True,
+        checkpoint_file=WORKER_CHECKPOINT_FILE,
+        stats_file=WORKER_STATS_FILE,
+    ):
+        self.store = store or get_application_store()
+        self.max_workers = max_workers
+        self.group_size = group_size
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retry_interval = retry_interval
+        self.use_cache = use_cache
+        self.checkpoint_file = checkpoint_file
+        self.stats_file = stats_file
+
+        self.started_at = time.time()
+        self.last_retry = self.started_at
+        self.in_flight = 0
+        self._completions = deque()
+
+        checkpoint = self._load_checkpoint()
+        self.last_application_id = checkpoint.get("last_application_id", 0)
+        # The retry pass walks the pending applications in id order from this cursor and wraps
+        # around at the end, so rows that keep failing cannot starve the ones behind them
+        self.retry_after_id = checkpoint.get("retry_after_id", 0)
+        self.scored_total = checkpoint.get("scored_total", 0)
+        self.failed_total = checkpoint.get("failed_total", 0)
+
+    def _load_checkpoint(self):
+        if not os.path.exists(self.checkpoint_file):
+            return {}
+        try:
+            with open(self.checkpoint_file, 'r') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            print(f"Could not read checkpoint {self.checkpoint_file}. Starting from the beginning.")
+            return {}
+
+    def _save_checkpoint(self):
+        _write_json_atomically(self.checkpoint_file, {
+            "last_application_id": self.last_application_id,
+            "retry_after_id": self.retry_after_id,
+            "scored_total": self.scored_total,
+            "failed_total": self.failed_total,
+        })
+
+    def _on_score(self, application_id, score):
+        self.store.set_score(application_id, score)
+        self.in_flight -= 1
+        if score is None:
+            self.failed_total += 1
+        else:
+            self.scored_total += 1
+            self._completions.append(time.time())
+
+    def throughput(self):
+        """
+        Applications scored per second over the last THROUGHPUT_WINDOW seconds, or None until the
+        worker has been up for a full window (a few early cache hits would read as a huge rate).
+        """
+        now = time.time()
+        cutoff = now - THROUGHPUT_WINDOW
+        while self._completions and self._completions[0] < cutoff:
+            self._completions.popleft()
+        if now - self.started_at < THROUGHPUT_WINDOW:
+            return None
+        return len(self._completions) / THROUGHPUT_WINDOW
+
+    def stats(self):
+        """Returns the worker's current metrics."""
+        throughput = self.throughput()
+        return {
+            "queue_depth": self.store.count_pending(),
+            "in_flight": self.in_flight,
+            "throughput_per_second": round(throughput, 3) if throughput is not None else None,
+            "scored_total": self.scored_total,
+            "failed_total": self.failed_total,
+            "last_application_id": self.last_application_id,
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+        }
+
+    def _score_batch(self, applications):
+        self.in_flight += len(applications)
+        try:
+            score_applications(
+                applications,
+                max_workers=self.max_workers,
+                use_cache=self.use_cache,
+                group_size=self.group_size,
+                on_score=self._on_score,
+            )
+        finally:
+            self.in_flight = 0
+            self.store.release([application['id'] for application in applications])
+
+    def run_once(self):
+        """Scores one batch of new applications (plus a retry batch when due). Returns the number handled."""
+        handled = 0
+
+        new_applications = self.store.claim_unscored(limit=self.batch_size, after_id=self.last_application_id)
+        if new_applications:
+            self._score_batch(new_applications)
+            self.last_application_id = max(application['id'] for application in new_applications)
+            handled += len(new_applications)
+
+        if time.time() - self.last_retry >= self.retry_interval:
+            self.last_retry = time.time()
+            retries = self.store.claim_unscored(limit=self.batch_size, after_id=self.retry_after_id)
+            # A short batch means the end of the pending queue was reached: start over next time
+            self.retry_after_id = max(application['id'] for application in retries) if len(retries) == self.batch_size else 0
+            if retries:
+                print(f"Retrying {len(retries)} previously unscored applications")
+                self._score_batch(retries)
+                handled += len(retries)
+
+        if handled:
+            self._save_checkpoint()
+            stats = self.stats()
+            _write_json_atomically(self.stats_file, stats)
+            print(f"Scored batch of {handled}: {stats}")
+        return handled
+
+    def run_forever(self):
+        """Polls for new applications until interrupted."""
+        print(f"Scoring worker started after application id {self.last_application_id}")
+        try:
+            while True:
+                if not self.run_once():
+                    time.sleep(self.poll_interval)
+        except KeyboardInterrupt:
+            print("Scoring worker stopped")
+        finally:
+            self._save_checkpoint()
+            _write_json_atomically(self.stats_file, self.stats())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Continuously score new applications as they arrive.")
+    parser.add_argument("--concurrency", type=int, default=SCORING_CONCURRENCY, help="Maximum number of Gemini requests in flight.")
+    parser.add_argument("--group-size", type=int, default=SCORING_GROUP_SIZE, help="Number of applicants to the same JD scored in one prompt.")
+    parser.add_argument("--batch-size", type=int, default=WORKER_BATCH_SIZE, help="Maximum number of applications claimed per poll.")
+    parser.add_argument("--poll-interval", type=float, default=WORKER_POLL_INTERVAL, help="Seconds to wait between polls when idle.")
+    parser.add_argument("--no-cache", action="store_true", help="Always call Gemini, bypassing the persistent score cache.")
+    metrics.add_arguments(parser)
+    args = parser.parse_args()
+    metrics.configure_from_args(args)
+
+    ScoringWorker(
+        max_workers=args.concurrency,
+        group_size=args.group_size,
+        batch_size=args.batch_size,
+        poll_interval=args.poll_interval,
+        use_cache=not args.no_cache,
+    ).run_forever()
@@ -0,0 +1,35 @@
+import json
+
+import pytest
+
+from score_candidates import SCORING_CRITERIA, parse_multi_score_response, parse_score_response
+
+
+SUBSCORES = {criterion: 50 for criterion in SCORING_CRITERIA}
+
+
+@pytest.mark.parametrize("number", ["NaN", "Infinity", "-Infinity", "1e400"])
+def test_non_finite_score_is_invalid(number):
+    response_text = f'{{"score": {number}, "subscores": {json.dumps(SUBSCORES)}}}'
+    assert parse_score_response(response_text) is None
+
+
+@pytest.mark.parametrize("number", ["NaN", "Infinity", "1e400"])
+def test_non_finite_subscore_is_invalid(number):
+    subscores = json.dumps(SUBSCORES).replace("50", number, 1)
+    assert parse_score_response(f'{{"score": 80, "subscores": {subscores}}}') is None
+
+
+@pytest.mark.parametrize("number", ["NaN", "Infinity", "1e400"])
+def test_non_finite_score_invalidates_group_reply(number):
+    response_text = (
+        f'[{{"candidate": 0, "score": 80, "subscores": {json.dumps(SUBSCORES)}}},'
+        f' {{"candidate": 1, "score": {number}, "subscores": {json.dumps(SUBSCORES)}}}]'
+    )
+    assert parse_multi_score_response(response_text, 2) is None
+
+
+def test_valid_score_is_parsed():
+    score, subscores = parse_score_response(json.dumps({"score": 80, "subscores": SUBSCORES}))
+    assert score == 80
+    assert subscores == SUBSCORES
@@ -0,0 +1,170 @@
+import argparse
+import json
+import os
+import sqlite3
+import threading
+
+from constants import USERS_DB_FILE, USERS_FILE
+
+
+USER_FIELDS = ("password", "linkedin_url", "name")
+
+
+class UserStore:
+    """
+    Keyed user store backed by SQLite.
+    Lookups and updates touch a single row, so page renders no longer read the whole user base
+    and concurrent sign-ups cannot overwrite each other.
+    """
+
+    def __init__(self, path=USERS_DB_FILE, legacy_json=USERS_FILE):
+        self.path = path
+        self._local = threading.local()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS users ("
+                " username TEXT PRIMARY KEY,"
+                " password TEXT NOT NULL,"
+                " linkedin_url TEXT,"
+                " name TEXT,"
+                " is_recruiter INTEGER NOT NULL DEFAULT 0)"
+            )
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(users)")}
+            if "is_recruiter" not in columns:
+                conn.execute("ALTER TABLE users ADD COLUMN is_recruiter INTEGER NOT NULL DEFAULT 0")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        if legacy_json:
+            self.import_json(legacy_json)
+
+    def _connect(self):
+        """Returns this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get_user(self, username):
+        """Returns the user's data as a dict ('password', 'linkedin_url', 'name'), or None if unknown."""
+        row = self._connect().execute(
+            "SELECT password, linkedin_url, name FROM users WHERE username = ?", (username,)
+        ).fetchone()
+        return dict(row) if row is not None else None
+
+    def create_user(self, username, password, linkedin_url=None, name=None):
+        """Creates a new user. Returns False if the username is already taken."""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT INTO users (username, password, linkedin_url, name) VALUES (?, ?, ?, ?)",
+                    (username, password, linkedin_url, name),
+                )
+        except sqlite3.IntegrityError:
+            return False
+        return True
+
+    def update_user(self, username, **fields):
+        """Atomically updates the given fields of one user. Returns False if the user does not exist."""
+        unknown = set(fields) - set(USER_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown user fields: {sorted(unknown)}")
+        if not fields:
+            return self.get_user(username) is not None
+        assignments = ", ".join(f"{field} = ?" for field in fields)
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                f"UPDATE users SET {assignments} WHERE username = ?",
+                (*fields.values(), username),
+            )
+        return cursor.rowcount == 1
+
+    def is_recruiter(self, username):
+        """True if an admin has granted the user recruiter access."""
+        row = self._connect().execute("SELECT is_recruiter FROM users WHERE username = ?", (username,)).fetchone()
+        return bool(row is not None and row["is_recruiter"])
+
+    def set_recruiter(self, username, recruiter=True):
+        """Grants or revokes recruiter access. Returns False if the user does not exist."""
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                "UPDATE users SET is_recruiter = ? WHERE username = ?", (int(recruiter), username)
+            )
+        return cursor.rowcount == 1
+
+    def list_recruiters(self):
+        """Returns the usernames with recruiter access."""
+        rows = self._connect().execute("SELECT username FROM users WHERE is_recruiter = 1 ORDER BY username").fetchall()
+        return [row["username"] for row in rows]
+
+    def import_json(self, json_path):
+        """
+        One-off migration of a legacy users.json into the store. Users that already exist in the
+        store are left untouched. Does nothing if this file has already been imported.
+        """
+        if not os.path.exists(json_path):
+            return 0
+        conn = self._connect()
+        key = f"imported:{os.path.abspath(json_path)}"
+        if conn.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+            return 0
+
+        try:
+            with open(json_path, 'r') as f:
+                users = json.loads(f.read() or "{}")
+        except json.JSONDecodeError:
+            print(f"Error decoding JSON from {json_path}. Skipping user migration.")
+            return 0
+
+        rows = [
+            (username, data.get('password'), data.get('linkedin_url'), data.get('name'))
+            for username, data in users.items()
+            if isinstance(data, dict) and data.get('password') is not None
+        ]
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO users (username, password, linkedin_url, name) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (key, str(len(rows))))
+        print(f"Imported {len(rows)} users from {json_path}")
+        return len(rows)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_user_store():
+    """Returns the process-wide user store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = UserStore()
+    return _store
+
+
+def is_recruiter(username):
+    """
+    True if the user has recruiter access. Access is stored on the account and only granted out of
+    band (python user_store.py --grant-recruiter USERNAME), never by signing up under some name.
+    """
+    return get_user_store().is_recruiter(username)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage recruiter access in the user store.")
+    parser.add_argument("--grant-recruiter", metavar="USERNAME", help="Give an existing user access to the recruiter leaderboards.")
+    parser.add_argument("--revoke-recruiter", metavar="USERNAME", help="Remove a user's recruiter access.")
+    args = parser.parse_args()
+
+    store = get_user_store()
+    for username, recruiter in ((args.grant_recruiter, True), (args.revoke_recruiter, False)):
+        if username and not store.set_recruiter(username, recruiter):
+            parser.error(f"Unknown user: {username}")
+    print(f"Recruiters: {store.list_recruiters()}")